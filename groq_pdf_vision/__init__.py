@@ -41,10 +41,16 @@ __version__ = "1.1.0"
 __author__ = "groq"
 __email__ = "ch@enfuse.io"
 
+import logging
+
+# Library logging stays silent unless the application configures a handler
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
 # Import main functions
 from .core import (
     extract_pdf_async,
     extract_pdf,
+    make_extractor,
     get_default_schema,
     auto_configure_processing,
 )
@@ -68,6 +74,7 @@ __all__ = [
     # Core functions
     "extract_pdf_async",
     "extract_pdf", 
+    "make_extractor",
     "get_default_schema",
     "auto_configure_processing",
     
@@ -0,0 +1,91 @@
+"""
+Per-page response cache for the Groq PDF Vision SDK
+"""
+
+import hashlib
+import os
+import sqlite3
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .utils import json_dumps, json_loads
+
+# Cache location and lifetime for per-page extraction results
+PAGE_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "groq_pdf_vision", "pages.sqlite")
+PAGE_CACHE_TTL = 24 * 60 * 60
+
+
+def page_cache_key(image_b64: str, schema_json: str, context: str = "") -> str:
+    """
+    Hash an encoded page image together with the schema it is extracted with.
+    
+    Args:
+        image_b64: Base64-encoded page image (or its data URL) sent to the model
+        schema_json: Canonical JSON of the extraction schema
+        context: Model id, prompt version and prompt options the response depends on
+    
+    Returns:
+        Hex SHA-256 digest identifying the page response
+    """
+    digest = hashlib.sha256()
+    for part in (image_b64.encode("ascii"), schema_json.encode("utf-8"), context.encode("utf-8")):
+        digest.update(len(part).to_bytes(8, "big"))
+        digest.update(part)
+    return digest.hexdigest()
+
+
+class PageCache:
+    """SQLite store mapping page cache keys to extracted page results."""
+    
+    def __init__(self, path: str = PAGE_CACHE_PATH, ttl: float = PAGE_CACHE_TTL):
+        """
+        Open (or create) the cache database and delete entries that have expired.
+        
+        Args:
+            path: SQLite database file
+            ttl: Seconds an entry stays valid
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.ttl = ttl
+        # May be used from a worker thread; callers must not use it from two threads at once
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, created REAL, value BLOB)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS responses_created ON responses (created)")
+            # Reads already skip expired rows; removing them keeps the file from growing forever
+            self._conn.execute("DELETE FROM responses WHERE created <= ?", (time.time() - self.ttl,))
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached page result for key, or None if absent or expired."""
+        row = self._conn.execute(
+            "SELECT value FROM responses WHERE key = ? AND created > ?",
+            (key, time.time() - self.ttl)
+        ).fetchone()
+        return json_loads(row[0]) if row else None
+    
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store a page result under key, replacing any earlier entry."""
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, created, value) VALUES (?, ?, ?)",
+                (key, time.time(), json_dumps(value))
+            )
+    
+    def get_many(self, keys: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """Return the cached page result (or None) for each key, in order."""
+        return [self.get(key) for key in keys]
+    
+    def set_many(self, items: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        """Store several (key, page result) pairs in a single transaction."""
+        now = time.time()
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO responses (key, created, value) VALUES (?, ?, ?)",
+                [(key, now, json_dumps(value)) for key, value in items]
+            )
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
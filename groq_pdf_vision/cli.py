@@ -5,8 +5,9 @@ Command Line Interface for the Groq PDF Vision SDK
 import argparse
 import asyncio
 import json
+import os
 import sys
-from typing import Optional
+from typing import List, Optional
 
 from .core import extract_pdf_async
 from .utils import (
@@ -56,9 +57,10 @@ def get_predefined_schema(schema_name: str) -> Optional[dict]:
     return None
 
 
-async def main():
-    """Main CLI function."""
+async def main(argv: Optional[List[str]] = None):
+    """Main CLI function. Parses argv, or sys.argv[1:] when argv is None."""
     parser = argparse.ArgumentParser(
+        prog="groq-pdf",
         description="Groq Document Comprehension - Transform PDFs into structured, actionable data with AI",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
@@ -112,7 +114,7 @@ Schema Options:
     parser.add_argument("--quiet", action="store_true", help="Suppress progress output")
     parser.add_argument("--version", action="version", version="groq-pdf-vision 1.0.0")
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     # Handle schema validation
     if args.validate_schema:
@@ -139,8 +141,14 @@ Schema Options:
     if args.info_only:
         print(f"📄 Analyzing PDF: {args.pdf_file}")
         
+        # Stat the file once and share it between the info and estimate helpers
+        try:
+            stat_result = os.stat(args.pdf_file)
+        except OSError:
+            stat_result = None  # get_pdf_info reports the error below
+        
         # Get PDF info
-        pdf_info = get_pdf_info(args.pdf_file)
+        pdf_info = get_pdf_info(args.pdf_file, stat_result)
         if not pdf_info.get("can_process"):
             print(f"❌ Cannot process PDF: {pdf_info.get('error')}")
             sys.exit(1)
@@ -149,7 +157,7 @@ Schema Options:
         print(f"   Total pages: {pdf_info['total_pages']}")
         
         # Get processing estimates
-        estimates = estimate_processing_time(args.pdf_file, args.start_page, args.end_page)
+        estimates = estimate_processing_time(args.pdf_file, args.start_page, args.end_page, stat_result)
         if "error" in estimates:
             print(f"❌ Error getting estimates: {estimates['error']}")
             sys.exit(1)
@@ -239,14 +247,25 @@ Schema Options:
         sys.exit(1)
 
 
-def cli_main():
-    """Entry point for the CLI."""
+def cli_main(argv: Optional[List[str]] = None) -> int:
+    """
+    Entry point for the CLI. Pass argv to run it in-process without sys.argv.
+    
+    Returns the exit code instead of exiting, so in-process callers (such as
+    the test suite) can check it; the console script exits with it.
+    """
     try:
-        asyncio.run(main())
+        asyncio.run(main(argv))
     except KeyboardInterrupt:
         print(f"\n⚠️  Interrupted by user")
-        sys.exit(1)
+        return 1
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        print(e.code, file=sys.stderr)
+        return 1
+    return 0
 
 
 if __name__ == "__main__":
-    cli_main() 
\ No newline at end of file
+    sys.exit(cli_main()) 
\ No newline at end of file
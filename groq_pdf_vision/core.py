@@ -3,30 +3,96 @@ Core PDF processing functions for the Groq PDF Vision SDK
 """
 
 import asyncio
+import contextlib
 import json
 import os
 import base64
+import copy
+import hashlib
+import logging
+import multiprocessing
+import random
+import threading
 import time
+from collections import OrderedDict, deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from io import BytesIO
-from typing import List, Dict, Any, Tuple, Optional, Callable
+from typing import List, Dict, Any, Tuple, Optional, Callable, Awaitable, NamedTuple, Union
 
-from groq import AsyncGroq
+from groq import (
+    APIConnectionError, APIStatusError, AsyncGroq, BadRequestError, InternalServerError, RateLimitError
+)
 import pypdfium2 as pdfium
 from PIL import Image
 
+from .cache import PageCache, page_cache_key
+from .ratelimit import shared_bucket
+from .utils import (
+    _PDFIUM_LOCK, _close_document, _open_document, compile_page_validator, json_dumps, json_loads
+)
+
+logger = logging.getLogger(__name__)
+
 # --- Configuration ---
 GROQ_MODEL_ID = "meta-llama/llama-4-scout-17b-16e-instruct"
 
+# Bump whenever the extraction prompt changes so cached responses are invalidated
+PROMPT_VERSION = 2
+
 # Image processing parameters
 IMAGE_FORMAT = "jpeg"
+# Page images travel from the render workers to the request body as ready-made data URLs
+IMAGE_DATA_URL_PREFIX = f"data:image/{IMAGE_FORMAT};base64,"
 BASE64_IMAGE_SIZE_LIMIT_MB = 3.5
 MAX_IMAGE_DIMENSION = 4096
+DEFAULT_IMAGE_QUALITY = 85
+
+# Typical JPEG bytes per pixel by quality for rendered document pages (highest first);
+# only ratios between rows are used, to predict how far quality must drop to fit
+JPEG_BYTES_PER_PIXEL = (
+    (85, 0.45), (75, 0.32), (65, 0.22), (55, 0.16), (45, 0.12), (35, 0.09), (25, 0.07), (15, 0.05)
+)
+
+# Batches rendered ahead of the API workers during extraction
+RENDER_PREFETCH_BATCHES = 8
+
+# Encoded pages each render worker keeps, keyed by pixel hash, so repeated pages skip JPEG encoding
+ENCODE_CACHE_SIZE = 16
+PIXEL_DIGEST_KEY = "groq_pdf_vision.pixel_digest"
 
 # Batch processing parameters for automatic scaling
 MAX_IMAGES_PER_BATCH = 5
-RATE_LIMIT_DELAY = 1.0
-MAX_RETRIES = 3
+# Conservative defaults that fit Groq's lowest rate-limit tier (30 requests per minute);
+# accounts with higher limits opt into more throughput via max_concurrency and qpm
+DEFAULT_MAX_CONCURRENCY = 2
+DEFAULT_QPM = 30
+DEFAULT_TPM = 0
+# Rough prompt tokens per request, used to charge the tokens-per-minute budget up front
+PROMPT_TOKEN_ESTIMATE = 2000
+IMAGE_TOKEN_ESTIMATE = 1500
+MAX_RETRIES = 5
 RETRY_DELAY = 2.0
+MAX_RETRY_DELAY = 60.0
+
+# Fields of the stand-in result for pages missing from a response or failed after retries
+EMPTY_PAGE_RESULT = {
+    "page_number": 0,
+    "content": "",
+    "custom_content": "",
+    "error": 0,
+    "name": "",
+    "result": "",
+    "wordings_and_terms": [],
+    "key_main_takeaways": [],
+    "primary_insights": [],
+    "explicit_sections": [],
+    "explicit_pages": [],
+    "contains_tables": False,
+    "contains_images": False,
+    "image_descriptions": [],
+    "visual_summary": "",
+    "tables_data": []
+}
 
 # Auto-scaling thresholds
 SMALL_PDF_THRESHOLD = 10
@@ -65,30 +131,116 @@ def auto_configure_processing(total_pages: int) -> Dict[str, Any]:
         return {"batch_size": 5, "dpi": 120, "description": "Enterprise PDF - Maximum batch efficiency"}
 
 
-def convert_pdf_to_images(pdf_path: str, dpi: int = 150, start_page: int = 1, end_page: Optional[int] = None) -> List[Image.Image]:
-    """Convert PDF pages to PIL Images using pypdfium2."""
-    try:
-        pdf = pdfium.PdfDocument(pdf_path)
-        total_pages = len(pdf)
-        
-        if end_page is None:
-            end_page = total_pages
-        
-        start_page = max(1, start_page)
-        end_page = min(total_pages, end_page)
-        
-        images = []
-        for page_num in range(start_page - 1, end_page):
+# Render processes are spawned, never forked: a fork taken while another extraction's
+# render thread holds _PDFIUM_LOCK would leave the child's copy locked forever
+_RENDER_MP_CONTEXT = multiprocessing.get_context("spawn")
+
+# Document opened once per render worker (a process or the dedicated render thread)
+_render_worker = threading.local()
+
+
+async def _shutdown_executor(executor: Executor) -> None:
+    """Wait for an executor's workers to finish without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, executor.shutdown)
+
+
+def _init_render_worker(pdf_path: str, pdf: Optional[pdfium.PdfDocument] = None) -> None:
+    """Executor initializer: open the document (or adopt an open one) for every batch this worker renders."""
+    _render_worker.path = pdf_path
+    _render_worker.pdf = pdf if pdf is not None else _open_document(pdf_path)[0]
+    _render_worker.encoded = OrderedDict()
+
+
+def _render_pages(
+    pdf: pdfium.PdfDocument, dpi: int, first_index: int, last_index: int, max_dimension: int,
+    digest: bool = False
+) -> List[Image.Image]:
+    """
+    Render pages [first_index, last_index) (0-indexed) of an open document.
+    
+    With digest=True each image's info[PIXEL_DIGEST_KEY] holds a SHA-256 of its pixels,
+    hashed from pdfium's bitmap buffer without copying it.
+    """
+    scale = dpi / 72.0
+    
+    images = []
+    for page_num in range(first_index, last_index):
+        with _PDFIUM_LOCK:
             page = pdf.get_page(page_num)
-            scale = dpi / 72.0
             
-            # Use simplified render call
-            pil_image = page.render(scale=scale).to_pil()
+            # Cap the scale so oversized pages come out of pdfium at the size limit
+            # instead of being rendered large and resampled afterwards
+            page_scale = min(scale, max_dimension / max(page.get_size()))
+            # Composite onto opaque white and emit RGB byte order inside pdfium, so the
+            # bitmap converts straight to an RGB image with no alpha flattening or channel swap
+            bitmap = page.render(
+                scale=page_scale, fill_color=(255, 255, 255, 255), rev_byteorder=True
+            )
+            pil_image = bitmap.to_pil()
+            if digest:
+                pil_image.info[PIXEL_DIGEST_KEY] = hashlib.sha256(bitmap.buffer).digest()
             
-            images.append(pil_image)
+            # to_pil copied the RGB pixels, so both can be freed now, under the lock,
+            # rather than on garbage collection, which would call into pdfium outside it
+            bitmap.close()
+            page.close()
         
-        pdf.close()
-        return images
+        images.append(pil_image)
+    return images
+
+
+def _render_page_range(
+    pdf_path: str, dpi: int, first_index: int, last_index: int,
+    max_dimension: int = MAX_IMAGE_DIMENSION, digest: bool = False
+) -> List[Image.Image]:
+    """Render pages [first_index, last_index) (0-indexed), reusing the worker's open document if any."""
+    if getattr(_render_worker, "path", None) == pdf_path:
+        return _render_pages(_render_worker.pdf, dpi, first_index, last_index, max_dimension, digest)
+    
+    pdf, _ = _open_document(pdf_path)
+    try:
+        return _render_pages(pdf, dpi, first_index, last_index, max_dimension, digest)
+    finally:
+        _close_document(pdf)
+
+
+def convert_pdf_to_images(
+    pdf_path: Union[str, pdfium.PdfDocument], dpi: int = 150, start_page: int = 1,
+    end_page: Optional[int] = None
+) -> List[Image.Image]:
+    """
+    Convert PDF pages to PIL Images using pypdfium2.
+    
+    Args:
+        pdf_path: Path to the PDF file, or an already open PdfDocument (left open)
+        dpi: Render resolution
+        start_page: First page to render (1-indexed)
+        end_page: Last page to render (1-indexed, inclusive; last page if None)
+    
+    Returns:
+        List of rendered page images in page order
+    """
+    try:
+        owns_document = not isinstance(pdf_path, pdfium.PdfDocument)
+        if owns_document:
+            pdf, total_pages = _open_document(pdf_path)
+        else:
+            pdf = pdf_path
+            with _PDFIUM_LOCK:
+                total_pages = len(pdf)
+        try:
+            
+            if end_page is None:
+                end_page = total_pages
+            
+            start_page = max(1, start_page)
+            end_page = min(total_pages, end_page)
+            
+            return _render_pages(pdf, dpi, start_page - 1, end_page, MAX_IMAGE_DIMENSION)
+        finally:
+            if owns_document:
+                _close_document(pdf)
         
     except Exception as e:
         raise Exception(f"Error converting PDF to images: {str(e)}")
@@ -111,10 +263,26 @@ def resize_image_if_needed(image: Image.Image, max_dimension: int = MAX_IMAGE_DI
     return image.resize((new_width, new_height), Image.Resampling.LANCZOS)
 
 
-def encode_image_to_base64(image: Image.Image, format: str = IMAGE_FORMAT, quality: int = 85) -> str:
+def _jpeg_size_factor(quality: int) -> float:
+    """Interpolate JPEG_BYTES_PER_PIXEL at a quality level (clamped to the table's range)."""
+    points = JPEG_BYTES_PER_PIXEL
+    if quality >= points[0][0]:
+        return points[0][1]
+    for (high_q, high_bpp), (low_q, low_bpp) in zip(points, points[1:]):
+        if quality >= low_q:
+            return low_bpp + (high_bpp - low_bpp) * (quality - low_q) / (high_q - low_q)
+    return points[-1][1]
+
+
+def encode_image_to_base64(
+    image: Image.Image, format: str = IMAGE_FORMAT, quality: int = DEFAULT_IMAGE_QUALITY,
+    max_dimension: int = MAX_IMAGE_DIMENSION
+) -> str:
     """Convert PIL Image to base64 string with size optimization."""
-    image = resize_image_if_needed(image)
+    # Pages rendered by this module already fit; this only resizes other images
+    image = resize_image_if_needed(image, max_dimension)
     
+    # Rendered pages are already RGB; only other images need flattening onto white
     if image.mode in ('RGBA', 'LA', 'P'):
         background = Image.new('RGB', image.size, (255, 255, 255))
         if image.mode == 'P':
@@ -123,20 +291,72 @@ def encode_image_to_base64(image: Image.Image, format: str = IMAGE_FORMAT, quali
         image = background
     
     buffer = BytesIO()
-    save_kwargs = {"format": format.upper(), "optimize": True}
+    # No optimize=True: the extra Huffman pass costs far more time than the few bytes it saves
+    save_kwargs = {"format": format.upper()}
     if format.lower() == "jpeg":
         save_kwargs["quality"] = quality
     
     image.save(buffer, **save_kwargs)
     
-    while buffer.tell() > BASE64_IMAGE_SIZE_LIMIT_MB * 1024 * 1024 and quality > 20:
-        quality -= 10
-        buffer = BytesIO()
-        save_kwargs["quality"] = quality
-        image.save(buffer, **save_kwargs)
+    # Base64 inflates by 4/3, so the encoded JPEG must stay under 3/4 of the limit.
+    # When it doesn't, scale the measured size by the LUT to pick one lower quality
+    # directly, then step down a level at a time only if that still misses
+    byte_limit = BASE64_IMAGE_SIZE_LIMIT_MB * 1024 * 1024 * 3 / 4
+    if format.lower() == "jpeg" and buffer.tell() > byte_limit:
+        measured_size = buffer.tell()
+        lower_qualities = [q for q, _ in JPEG_BYTES_PER_PIXEL if q < quality]
+        candidates = [
+            q for q in lower_qualities
+            if measured_size * _jpeg_size_factor(q) / _jpeg_size_factor(quality) <= byte_limit
+        ]
+        start = lower_qualities.index(candidates[0]) if candidates else len(lower_qualities) - 1
+        for quality in lower_qualities[start:]:
+            buffer = BytesIO()
+            save_kwargs["quality"] = quality
+            image.save(buffer, **save_kwargs)
+            if buffer.tell() <= byte_limit:
+                break
+    
+    # Encode straight from the buffer's memory (no getvalue() copy); base64 is pure ASCII
+    with buffer.getbuffer() as view:
+        return base64.b64encode(view).decode('ascii')
+
+
+def _render_and_encode_range(
+    pdf_path: str, dpi: int, first_index: int, last_index: int,
+    quality: int = DEFAULT_IMAGE_QUALITY, max_dimension: int = MAX_IMAGE_DIMENSION
+) -> List[str]:
+    """
+    Render pages [first_index, last_index) (0-indexed) and encode them as base64 data URLs.
+    
+    The URL is built here, in the worker, so the event loop never formats or holds a
+    second full-size copy of each page.
+    """
+    encoded = getattr(_render_worker, "encoded", None)
+    images = _render_page_range(
+        pdf_path, dpi, first_index, last_index, max_dimension, digest=encoded is not None
+    )
+    if encoded is None:
+        return [
+            IMAGE_DATA_URL_PREFIX + encode_image_to_base64(image, IMAGE_FORMAT, quality, max_dimension)
+            for image in images
+        ]
     
-    buffer.seek(0)
-    return base64.b64encode(buffer.getvalue()).decode('utf-8')
+    # Visually identical pages (templates, blank pages, repeated forms) reuse the
+    # earlier encoding; hashing the pixels costs far less than a JPEG encode
+    image_urls = []
+    for image in images:
+        key = (image.info[PIXEL_DIGEST_KEY], image.size, quality, max_dimension)
+        image_url = encoded.get(key)
+        if image_url is None:
+            image_url = IMAGE_DATA_URL_PREFIX + encode_image_to_base64(image, IMAGE_FORMAT, quality, max_dimension)
+            encoded[key] = image_url
+            if len(encoded) > ENCODE_CACHE_SIZE:
+                encoded.popitem(last=False)
+        else:
+            encoded.move_to_end(key)
+        image_urls.append(image_url)
+    return image_urls
 
 
 def generate_example_from_schema(schema_dict):
@@ -191,76 +411,253 @@ def generate_example_from_schema(schema_dict):
     return example
 
 
-async def process_batch_with_retry(
-    client: AsyncGroq, images: List[str], schema: Dict[str, Any],
-    batch_num: int, total_batches: int, page_numbers: List[int]
-) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
-    """Process a batch of images with retry logic."""
-    
-    for attempt in range(MAX_RETRIES):
-        try:
-            # Generate example structure from the provided schema
-            example_structure = generate_example_from_schema(schema)
-            example_json = json.dumps({"pages": [example_structure]}, indent=2)
-            
-            # Create a more explicit prompt that uses the custom schema
-            prompt_text = f"""Extract data from these PDF pages and return as a valid JSON object with a "pages" array.
+# Extraction rules that follow the schema example in every request; the table and
+# visual rules are only sent when the schema has fields they apply to
+EXTRACTION_RULES = """Rules:
+- Use the exact field names and types of the example, filled with REAL data from the pages.
+- Never return the example values or placeholder text; use "", [] or false when a value is not on the page."""
+TABLE_RULE = (
+    "- Tables: set contains_tables only when a table is present; give each table's actual title, "
+    "column headers and rows, or empty arrays for parts that cannot be read."
+)
+VISUAL_RULE = (
+    "- Visuals: describe the charts, graphs, diagrams, photos, illustrations, maps, logos and "
+    "screenshots on the page in the image fields."
+)
+TABLE_FIELDS = {"contains_tables", "tables_data"}
+VISUAL_FIELDS = {"contains_images", "image_descriptions", "visual_summary"}
 
-IMPORTANT: Return EXACTLY this structure based on the provided schema:
+
+def build_prompt_header(schema: Dict[str, Any]) -> str:
+    """
+    Build the schema-derived part of the extraction prompt (everything but the page list).
+    
+    It depends only on the schema, so callers build it once per document and
+    reuse it for every batch and retry.
+    
+    Args:
+        schema: JSON schema for extraction
+    
+    Returns:
+        Prompt text with the compact example JSON structure and the extraction rules
+    """
+    # Generate example structure from the provided schema
+    example_structure = generate_example_from_schema(schema)
+    example_json = json.dumps({"pages": [example_structure]}, separators=(",", ":"))
+    
+    rules = [EXTRACTION_RULES]
+    properties = schema.get("properties", {})
+    if TABLE_FIELDS.intersection(properties):
+        rules.append(TABLE_RULE)
+    if VISUAL_FIELDS.intersection(properties):
+        rules.append(VISUAL_RULE)
+    
+    rules_text = "\n".join(rules)
+    return f"""Extract the data on each PDF page. Return ONLY a JSON object with a "pages" array holding one object per page, in page order, shaped like this example:
 {example_json}
 
-Process these pages: {page_numbers}
+{rules_text}"""
 
-CRITICAL INSTRUCTIONS:
-1. DO NOT use placeholder or example data like "example_table_title", "example1", "example2"
-2. Extract REAL data from the PDF pages
-3. If a table exists but data cannot be extracted, use empty arrays [] for headers and rows
-4. If no table exists, set contains_tables to false and tables_data to empty array
 
-COMPREHENSIVE EXTRACTION INSTRUCTIONS:
-1. TEXT CONTENT: Extract all actual text content according to the schema fields.
+def build_extraction_messages(
+    schema: Dict[str, Any], images: List[str], page_numbers: List[int], cached_schema: bool = False,
+    prompt_header: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    Build the chat messages asking the model to extract a batch of pages.
+    
+    Args:
+        schema: JSON schema for extraction
+        images: Page images as base64 strings or ready-made data URLs
+        page_numbers: Page numbers of the images, in order
+        cached_schema: Put the schema example and instructions in a system message that is
+            byte-identical for every batch, so the provider can serve it from its prompt-prefix
+            cache; only the page numbers and images vary in the user message
+        prompt_header: Result of build_prompt_header(schema), built here if None
+    
+    Returns:
+        List of chat messages for the completion request
+    """
+    header = prompt_header if prompt_header is not None else build_prompt_header(schema)
+    
+    # Data URLs are passed through as-is rather than copied into a new string
+    image_blocks = [
+        {
+            "type": "image_url",
+            "image_url": {"url": image if image.startswith("data:") else IMAGE_DATA_URL_PREFIX + image}
+        } for image in images
+    ]
+    
+    if cached_schema:
+        return [
+            {"role": "system", "content": header},
+            {
+                "role": "user",
+                "content": [{"type": "text", "text": f"Process these pages: {page_numbers}"}] + image_blocks
+            }
+        ]
+    
+    # Create a more explicit prompt that uses the custom schema
+    prompt_text = f"{header}\n\nProcess these pages: {page_numbers}"
+    return [
+        {
+            "role": "user",
+            "content": [
+                {
+                    "type": "text",
+                    "text": prompt_text
+                }
+            ] + image_blocks
+        }
+    ]
 
-2. TABLE EXTRACTION: For each table found:
-   - Extract the ACTUAL table title/caption (not "example_table_title")
-   - Extract the REAL column headers from the table
-   - Extract the ACTUAL row data from each row
-   - If extraction fails, use empty arrays instead of placeholder text
-   - Set contains_tables to true only if tables are actually found
 
-3. VISUAL ELEMENTS: If the schema includes image-related fields, carefully analyze all visual elements including:
-   - Charts and graphs (bar, line, pie, scatter, etc.)
-   - Diagrams and flowcharts
-   - Images and photographs
-   - Logos and branding elements
-   - Illustrations and drawings
-   - Maps and technical drawings
-   - Screenshots or interface elements
+def build_feedback_messages(content: str, error: str) -> List[Dict[str, Any]]:
+    """
+    Build follow-up messages that show the model its invalid output and ask for a fix.
+    
+    Args:
+        content: The model's previous response
+        error: Description of what was wrong with it
+    
+    Returns:
+        Assistant and user messages to append to the next attempt
+    """
+    return [
+        {"role": "assistant", "content": content},
+        {
+            "role": "user",
+            "content": f"Your output had an error: {error}. Fix it and return ONLY the corrected JSON object with the \"pages\" array."
+        }
+    ]
 
-4. SCHEMA COMPLIANCE: Follow the exact field names and types specified in the schema.
 
-5. DATA QUALITY: 
-   - Use REAL data from the PDF, never placeholder text
-   - If data cannot be extracted, use appropriate empty values (empty strings, empty arrays, false)
-   - Ensure table headers and rows contain actual data or remain empty
+def _placeholder_result(page_num: int, content: str, result: str, error: int) -> Dict[str, Any]:
+    """
+    Build the stand-in result for a page the model did not return.
+    
+    Args:
+        page_num: Page number (1-indexed)
+        content: Text for the content field
+        result: Text for the result field
+        error: 1 if the page failed, 0 if it was only missing from the response
+    
+    Returns:
+        Fresh copy of EMPTY_PAGE_RESULT filled in for the page
+    """
+    page_result = copy.deepcopy(EMPTY_PAGE_RESULT)
+    page_result.update(
+        page_number=page_num, content=content, error=error,
+        name=f"Page {page_num}", result=result, explicit_pages=[page_num]
+    )
+    return page_result
 
-Return ONLY the JSON object with the "pages" array containing one object per page that matches the schema structure."""
 
-            messages = [
-                {
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": prompt_text
-                        }
-                    ] + [
-                        {
-                            "type": "image_url",
-                            "image_url": {"url": f"data:image/{IMAGE_FORMAT};base64,{img_b64}"}
-                        } for img_b64 in images
-                    ]
-                }
-            ]
+def _extract_json_object(content: str) -> Optional[str]:
+    """
+    Find the outermost balanced JSON object in a model response.
+    
+    Recovers output wrapped in prose or code fences without another request.
+    
+    Args:
+        content: Raw response text
+    
+    Returns:
+        The text from the first "{" to its matching "}", or None if unbalanced
+    """
+    start = content.find("{")
+    if start < 0:
+        return None
+    
+    depth = 0
+    in_string = False
+    escaped = False
+    for index in range(start, len(content)):
+        char = content[index]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return content[start:index + 1]
+    return None
+
+
+def _is_retryable(error: Exception) -> bool:
+    """
+    Decide whether a failed batch request is worth another attempt.
+    
+    Rate limits, server errors, timeouts and dropped connections are transient, and
+    invalid model output is retried with feedback. Other API rejections (bad request,
+    authentication, permissions) fail the same way every time.
+    
+    Args:
+        error: Exception raised by the attempt
+    
+    Returns:
+        True if the batch should be retried
+    """
+    if isinstance(error, (RateLimitError, InternalServerError, APIConnectionError)):
+        return True
+    if isinstance(error, BadRequestError):
+        # JSON mode rejects a generation that is not valid JSON with a 400; a new sample usually passes
+        return "json_validate_failed" in str(error)
+    if isinstance(error, APIStatusError):
+        return error.status_code in (408, 409)
+    return True
+
+
+async def process_batch_with_retry(
+    client: AsyncGroq, images: List[str], schema: Dict[str, Any],
+    batch_num: int, total_batches: int, page_numbers: List[int],
+    cached_schema: bool = False,
+    validate_page: Optional[Callable[[Any], Optional[str]]] = None,
+    prompt_header: Optional[str] = None
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """Process a batch of images with retry logic."""
+    batch_results, usage_info, _ = await _request_batch(
+        client, images, schema, batch_num, total_batches, page_numbers,
+        cached_schema, validate_page, prompt_header
+    )
+    return batch_results, usage_info
+
+
+async def _request_batch(
+    client: AsyncGroq, images: List[str], schema: Dict[str, Any],
+    batch_num: int, total_batches: int, page_numbers: List[int],
+    cached_schema: bool = False,
+    validate_page: Optional[Callable[[Any], Optional[str]]] = None,
+    prompt_header: Optional[str] = None
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any], int]:
+    """
+    Process a batch of images with retry logic (see process_batch_with_retry).
+    
+    Returns:
+        Tuple of (page results, token usage, number of leading results the model actually
+        returned); results past that count are placeholders and must not be cached
+    """
+    
+    # The schema-derived prompt is identical for every attempt
+    if prompt_header is None:
+        prompt_header = build_prompt_header(schema)
+    
+    # Messages describing the previous attempt's invalid output, sent with the next retry
+    feedback: List[Dict[str, Any]] = []
+    
+    for attempt in range(MAX_RETRIES):
+        try:
+            messages = build_extraction_messages(
+                schema, images, page_numbers, cached_schema, prompt_header
+            ) + feedback
             
             # Use json_object format with lower temperature for more consistent results
             response = await client.chat.completions.create(
@@ -274,7 +671,14 @@ Return ONLY the JSON object with the "pages" array containing one object per pag
             content = response.choices[0].message.content
             
             try:
-                parsed_content = json.loads(content)
+                try:
+                    parsed_content = json_loads(content)
+                except json.JSONDecodeError:
+                    # Salvage an object surrounded by extra text before spending a retry on it
+                    candidate = _extract_json_object(content)
+                    if candidate is None:
+                        raise
+                    parsed_content = json_loads(candidate)
                 
                 # Handle different response structures more robustly
                 if isinstance(parsed_content, dict):
@@ -290,35 +694,30 @@ Return ONLY the JSON object with the "pages" array containing one object per pag
                 elif isinstance(parsed_content, list):
                     batch_results = parsed_content
                 else:
+                    feedback = build_feedback_messages(content, f"expected a JSON object, got {type(parsed_content).__name__}")
                     raise Exception(f"Unexpected response format: {type(parsed_content)}")
                 
+                # Schema mismatches are retried with feedback; the last attempt's output is kept
+                if validate_page is not None and attempt < MAX_RETRIES - 1:
+                    for page_result in batch_results:
+                        error = validate_page(page_result)
+                        if error:
+                            feedback = build_feedback_messages(content, f"a page does not match the schema ({error})")
+                            raise Exception(f"Schema validation failed: {error}")
+                
                 # Validate that we have the expected number of results
+                returned_pages = min(len(batch_results), len(page_numbers))
                 if len(batch_results) != len(page_numbers):
                     # Pad with empty results if needed using proper empty structure
                     while len(batch_results) < len(page_numbers):
                         page_num = page_numbers[len(batch_results)]
                         # Create proper empty result instead of example data
-                        empty_result = {
-                            "page_number": page_num,
-                            "content": f"Partial processing for page {page_num}",
-                            "custom_content": "",
-                            "error": 0,
-                            "name": f"Page {page_num}",
-                            "result": f"Processed page {page_num}",
-                            "wordings_and_terms": [],
-                            "key_main_takeaways": [],
-                            "primary_insights": [],
-                            "explicit_sections": [],
-                            "explicit_pages": [page_num],
-                            "contains_tables": False,
-                            "contains_images": False,
-                            "image_descriptions": [],
-                            "visual_summary": "",
-                            "tables_data": []
-                        }
-                        batch_results.append(empty_result)
+                        batch_results.append(_placeholder_result(
+                            page_num, f"Partial processing for page {page_num}", f"Processed page {page_num}", 0
+                        ))
                 
             except json.JSONDecodeError as e:
+                feedback = build_feedback_messages(content, f"invalid JSON ({e})")
                 raise Exception(f"Invalid JSON response: {e}\nContent: {content[:500]}...")
             
             usage_info = {
@@ -327,36 +726,55 @@ Return ONLY the JSON object with the "pages" array containing one object per pag
                 "total_tokens": response.usage.total_tokens
             }
             
-            return batch_results, usage_info
+            return batch_results, usage_info, returned_pages
             
         except Exception as e:
-            if attempt < MAX_RETRIES - 1:
-                delay = RETRY_DELAY * (2 ** attempt)
+            if attempt < MAX_RETRIES - 1 and _is_retryable(e):
+                # Jitter keeps concurrent batches that failed together from retrying in lockstep
+                delay = min(RETRY_DELAY * (2 ** attempt) + random.uniform(0, 1), MAX_RETRY_DELAY)
+                logger.warning(
+                    "Batch %d/%d attempt %d/%d failed: %s; retrying in %.1fs",
+                    batch_num, total_batches, attempt + 1, MAX_RETRIES, e, delay
+                )
                 await asyncio.sleep(delay)
             else:
-                empty_results = []
-                for page_num in page_numbers:
-                    # Create proper empty error result instead of example data
-                    error_result = {
-                        "page_number": page_num,
-                        "content": f"Failed to process page {page_num}",
-                        "custom_content": "",
-                        "error": 1,
-                        "name": f"Page {page_num}",
-                        "result": f"Failed to process page {page_num}",
-                        "wordings_and_terms": [],
-                        "key_main_takeaways": [],
-                        "primary_insights": [],
-                        "explicit_sections": [],
-                        "explicit_pages": [page_num],
-                        "contains_tables": False,
-                        "contains_images": False,
-                        "image_descriptions": [],
-                        "visual_summary": "",
-                        "tables_data": []
-                    }
-                    empty_results.append(error_result)
-                return empty_results, {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+                logger.error("Batch %d/%d failed for pages %s: %s", batch_num, total_batches, page_numbers, e)
+                # Create proper empty error results instead of example data
+                empty_results = [
+                    _placeholder_result(
+                        page_num, f"Failed to process page {page_num}", f"Failed to process page {page_num}", 1
+                    )
+                    for page_num in page_numbers
+                ]
+                return empty_results, {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}, 0
+
+
+def _dedup_key(item: Any) -> Any:
+    """Return a hashable key that is equal for equal list items, including dicts and lists."""
+    if isinstance(item, (dict, list)):
+        return json.dumps(item, sort_keys=True, default=str)
+    return item
+
+
+def _is_real_item(field_name: str, item: Any) -> bool:
+    """Return False for list items that echo the prompt's example data or are empty tables."""
+    # Special handling for tables_data to filter out empty/example tables
+    if field_name == 'tables_data' and isinstance(item, dict):
+        table_title = item.get('table_title', '').lower()
+        return bool(
+            table_title and
+            not table_title.startswith(('example', 'actual_')) and
+            table_title != 'actual title from document' and
+            (item.get('headers', []) or item.get('rows', []))  # Has actual content
+        )
+    
+    # Skip obvious example/dummy data patterns
+    item_str = str(item).lower()
+    return not (
+        item_str.startswith(('example', 'actual_')) or
+        'placeholder' in item_str or
+        item_str == 'actual title from document'
+    )
 
 
 def accumulate_results(all_results: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -388,6 +806,54 @@ def accumulate_results(all_results: List[Dict[str, Any]]) -> Dict[str, Any]:
     if any("visual_summary" in result for result in all_results):
         accumulated["visual_summaries"] = []
     
+    # Keys of the items already kept in each list field, for constant-time duplicate checks
+    seen: Dict[str, set] = {}
+    # Page contents are joined once at the end instead of concatenated page by page
+    content_parts: List[str] = []
+    # Descriptive fields filled by more than one page, replaced by a combined description at the end
+    combined = set()
+    
+    def add_text(field_name: str, text: str) -> None:
+        if not text:
+            return
+        if field_name == "content":
+            content_parts.append(text)
+        elif accumulated[field_name] == "":
+            accumulated[field_name] = text
+        elif field_name in ("name", "result"):
+            combined.add(field_name)
+    
+    def add_items(field_name: str, items: list) -> None:
+        if not items:
+            return
+        seen_keys = seen.get(field_name)
+        if seen_keys is None:
+            seen_keys = seen[field_name] = {_dedup_key(item) for item in accumulated[field_name]}
+        
+        # For arrays, extend with unique items but exclude example data
+        for item in items:
+            if not item:
+                continue
+            item_key = _dedup_key(item)
+            if item_key not in seen_keys and _is_real_item(field_name, item):
+                seen_keys.add(item_key)
+                accumulated[field_name].append(item)
+    
+    def add_flag(field_name: str, flag: bool) -> None:
+        # For booleans, use OR logic (true if any page is true)
+        accumulated[field_name] = accumulated[field_name] or flag
+    
+    def add_number(field_name: str, number: Union[int, float]) -> None:
+        # For numbers, handle based on field name
+        if field_name == "error":
+            accumulated[field_name] = max(accumulated[field_name], number)
+        elif "count" in field_name.lower() or "total" in field_name.lower():
+            accumulated[field_name] += number
+        # For other numbers, keep the first non-zero value or average
+    
+    # Parsed JSON values have exact builtin types, so one lookup picks the handler
+    handlers = {str: add_text, list: add_items, bool: add_flag, int: add_number, float: add_number}
+    
     # Accumulate data from all pages
     for page_result in all_results:
         for field_name, field_value in page_result.items():
@@ -398,78 +864,24 @@ def accumulate_results(all_results: List[Dict[str, Any]]) -> Dict[str, Any]:
                 accumulated[field_name] = field_value
                 continue
             
-            # Handle different field types
-            if isinstance(field_value, str) and field_value:
-                if field_name == "content":
-                    accumulated[field_name] += field_value + " "
-                elif accumulated[field_name] == "":
-                    accumulated[field_name] = field_value
-                elif field_name in ["name", "result", "custom_content"]:
-                    # For these fields, create a combined description
-                    if field_name == "name":
-                        accumulated[field_name] = f"Accumulated Pages 1-{len(all_results)}"
-                    elif field_name == "result":
-                        accumulated[field_name] = f"Accumulated analysis of {len(all_results)} pages"
-                    elif field_name == "custom_content" and accumulated[field_name] == "":
-                        accumulated[field_name] = field_value
-            
-            elif isinstance(field_value, list) and field_value:
-                # For arrays, extend with unique items but exclude example data
-                for item in field_value:
-                    # Enhanced filtering for example/dummy data
-                    if (item and item not in accumulated[field_name]):
-                        # Skip obvious example/dummy data patterns
-                        item_str = str(item).lower()
-                        is_example_data = (
-                            item_str.startswith('example') or
-                            item_str.startswith('actual_') or
-                            item_str in ['example1', 'example2', 'example_table_title', 'example summary'] or
-                            'placeholder' in item_str or
-                            item_str == 'actual title from document' or
-                            item_str.startswith('actual_data_') or
-                            item_str.startswith('actual_item_')
-                        )
-                        
-                        # Special handling for tables_data to filter out empty/example tables
-                        if field_name == 'tables_data' and isinstance(item, dict):
-                            table_title = item.get('table_title', '').lower()
-                            headers = item.get('headers', [])
-                            rows = item.get('rows', [])
-                            
-                            # Skip if table has example data or is empty
-                            has_real_data = (
-                                table_title and 
-                                not table_title.startswith('example') and
-                                not table_title.startswith('actual_') and
-                                table_title != 'actual title from document' and
-                                (headers or rows)  # Has actual content
-                            )
-                            
-                            if has_real_data:
-                                accumulated[field_name].append(item)
-                        elif not is_example_data:
-                            accumulated[field_name].append(item)
-            
-            elif isinstance(field_value, bool):
-                # For booleans, use OR logic (true if any page is true)
-                accumulated[field_name] = accumulated[field_name] or field_value
-            
-            elif isinstance(field_value, (int, float)):
-                # For numbers, handle based on field name
-                if field_name == "error":
-                    accumulated[field_name] = max(accumulated[field_name], field_value)
-                elif "count" in field_name.lower() or "total" in field_name.lower():
-                    accumulated[field_name] += field_value
-                # For other numbers, keep the first non-zero value or average
+            handler = handlers.get(type(field_value))
+            if handler is not None:
+                handler(field_name, field_value)
         
         # Special handling for visual summaries
         if "visual_summary" in page_result and page_result["visual_summary"]:
             if "visual_summaries" in accumulated:
                 accumulated["visual_summaries"].append(page_result["visual_summary"])
     
-    # Clean up content field
+    # For these fields, create a combined description
+    if "name" in combined:
+        accumulated["name"] = f"Accumulated Pages 1-{len(all_results)}"
+    if "result" in combined:
+        accumulated["result"] = f"Accumulated analysis of {len(all_results)} pages"
+    
+    # Assemble and clean up content field
     if "content" in accumulated:
-        accumulated["content"] = accumulated["content"].strip()
+        accumulated["content"] = (accumulated["content"] + " ".join(content_parts)).strip()
     
     # Clean up any page-specific arrays that might have duplicates
     for field_name, field_value in accumulated.items():
@@ -479,6 +891,32 @@ def accumulate_results(all_results: List[Dict[str, Any]]) -> Dict[str, Any]:
     return accumulated
 
 
+def write_results_file(output_filename: str, output_data: Dict[str, Any]) -> None:
+    """Serialize results as indented JSON (orjson when installed) and write them to disk."""
+    with open(output_filename, 'wb') as f:
+        f.write(json_dumps(output_data, indent=True))
+
+
+class _PreparedSchema(NamedTuple):
+    """Everything derived from the schema alone, built once and shared by runs that use it."""
+    schema: Dict[str, Any]
+    schema_json: str
+    prompt_header: str
+    validate_page: Optional[Callable[[Any], Optional[str]]]
+
+
+def _prepare_schema(schema: Optional[Dict[str, Any]], validate_pages: bool) -> _PreparedSchema:
+    """Resolve the default schema and build its cache key text, prompt header and validator."""
+    if schema is None:
+        schema = get_default_schema()
+    return _PreparedSchema(
+        schema=schema,
+        schema_json=json.dumps(schema, sort_keys=True),
+        prompt_header=build_prompt_header(schema),
+        validate_page=compile_page_validator(schema) if validate_pages else None
+    )
+
+
 async def extract_pdf_async(
     pdf_file_path: str,
     schema: Optional[Dict[str, Any]] = None,
@@ -487,7 +925,19 @@ async def extract_pdf_async(
     progress_callback: Optional[Callable[[str, int, int], None]] = None,
     save_results: bool = False,
     output_filename: Optional[str] = None,
-    api_key: Optional[str] = None
+    api_key: Optional[str] = None,
+    client: Optional[AsyncGroq] = None,
+    enable_page_cache: bool = False,
+    cached_schema: bool = False,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    qpm: int = DEFAULT_QPM,
+    page_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+    pages_per_request: Optional[int] = None,
+    image_quality: int = DEFAULT_IMAGE_QUALITY,
+    max_edge: int = MAX_IMAGE_DIMENSION,
+    validate_pages: bool = False,
+    tpm: int = DEFAULT_TPM,
+    render_processes: int = 0
 ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
     """
     Extract data from PDF with automatic configuration and accumulated results (async).
@@ -501,74 +951,285 @@ async def extract_pdf_async(
         save_results: Whether to save results to JSON file
         output_filename: Custom output filename (auto-generated if None)
         api_key: Groq API key (uses environment/file if None)
+        client: Existing AsyncGroq client to reuse, so several documents share one
+            connection pool (a client is created and closed per call if None)
+        enable_page_cache: Reuse results for pages whose rendered image and schema
+            match an earlier request within the last 24 hours (skips the API call)
+        cached_schema: Send the schema and instructions as an identical system message on
+            every batch so they can be served from the provider's prompt-prefix cache
+        max_concurrency: Maximum number of batch requests in flight at once (1 = serial);
+            pages are rendered in the background while requests are in flight
+        qpm: Maximum request starts per minute, allowing bursts up to that many; 0 disables it.
+            The budget is shared by all extractions running on the same event loop
+        page_callback: Function called with each page result as soon as its batch finishes,
+            so callers can stream pages out (batches may complete out of page order)
+        pages_per_request: Pages sent together in one multi-image request, overriding the
+            size-based default (capped at MAX_IMAGES_PER_BATCH)
+        image_quality: Starting JPEG quality for page images (lowered automatically if a
+            page exceeds the upload size limit)
+        max_edge: Longest side in pixels of uploaded page images; larger renders are downscaled
+        validate_pages: Check each page result against the schema with a compiled validator
+            (requires the 'fast' extra) and retry mismatching batches with the error as feedback
+        tpm: Maximum estimated prompt tokens per minute (about 1500 per page image plus
+            2000 per request), shared like qpm; 0 disables it
+        render_processes: Render and encode pages in up to this many worker processes
+            (capped at the number of batches); 0 or 1 renders on one background thread.
+            Processes are spawned, so the calling script must guard its entry point with
+            if __name__ == "__main__"
     
     Returns:
         Tuple of (extraction_results, processing_metadata)
     """
-    
+    return await _extract_prepared(
+        pdf_file_path,
+        _prepare_schema(schema, validate_pages),
+        start_page=start_page,
+        end_page=end_page,
+        progress_callback=progress_callback,
+        save_results=save_results,
+        output_filename=output_filename,
+        api_key=api_key,
+        client=client,
+        enable_page_cache=enable_page_cache,
+        cached_schema=cached_schema,
+        max_concurrency=max_concurrency,
+        qpm=qpm,
+        page_callback=page_callback,
+        pages_per_request=pages_per_request,
+        image_quality=image_quality,
+        max_edge=max_edge,
+        tpm=tpm,
+        render_processes=render_processes
+    )
+
+
+async def _extract_prepared(
+    pdf_file_path: str,
+    prepared: _PreparedSchema,
+    start_page: Optional[int] = None,
+    end_page: Optional[int] = None,
+    progress_callback: Optional[Callable[[str, int, int], None]] = None,
+    save_results: bool = False,
+    output_filename: Optional[str] = None,
+    api_key: Optional[str] = None,
+    client: Optional[AsyncGroq] = None,
+    enable_page_cache: bool = False,
+    cached_schema: bool = False,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    qpm: int = DEFAULT_QPM,
+    page_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+    pages_per_request: Optional[int] = None,
+    image_quality: int = DEFAULT_IMAGE_QUALITY,
+    max_edge: int = MAX_IMAGE_DIMENSION,
+    tpm: int = DEFAULT_TPM,
+    render_processes: int = 0
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Run extract_pdf_async with the schema work already done (see its docstring for the options)."""
     if api_key:
         os.environ["GROQ_API_KEY"] = api_key
     
-    api_key = load_api_key()
-    
-    # Use async context manager for proper cleanup
-    async with AsyncGroq(api_key=api_key) as client:
-        if schema is None:
-            schema = get_default_schema()
+    # Use async context manager for proper cleanup; a caller's client is left open for reuse
+    async with contextlib.AsyncExitStack() as stack:
+        if client is None:
+            client = await stack.enter_async_context(AsyncGroq(api_key=load_api_key()))
         
-        pdf = pdfium.PdfDocument(pdf_file_path)
-        total_pages = len(pdf)
-        pdf.close()
+        schema, schema_json, prompt_header, validate_page = prepared
+        
+        # Results of this run by page key, so repeated pages are requested only once
+        # Everything besides the page and schema that shapes a response is part of the key
+        cache_context = f"{GROQ_MODEL_ID}|prompt-v{PROMPT_VERSION}|cached_schema={cached_schema}"
+        run_results: Dict[str, Dict[str, Any]] = {}
+        loop = asyncio.get_running_loop()
+        page_cache = None
+        if enable_page_cache:
+            # SQLite reads and commits, including the expiry pass on open, run on one
+            # dedicated thread, off the event loop; the cache is closed there last
+            cache_pool = ThreadPoolExecutor(max_workers=1)
+            stack.push_async_callback(_shutdown_executor, cache_pool)
+            page_cache = await loop.run_in_executor(cache_pool, PageCache)
+            stack.push_async_callback(loop.run_in_executor, cache_pool, page_cache.close)
+        
+        # Opened once: gives the page count and, when rendering on a thread, is the
+        # handle the render thread uses (worker processes open their own)
+        pdf, total_pages = await loop.run_in_executor(None, _open_document, pdf_file_path)
+        stack.push_async_callback(loop.run_in_executor, None, _close_document, pdf)
         
         if start_page is None:
             start_page = 1
         if end_page is None:
             end_page = total_pages
         
-        pages_to_process = end_page - start_page + 1
+        start_page = max(1, start_page)
+        end_page = min(total_pages, end_page)
+        pages_to_process = max(0, end_page - start_page + 1)
         config = auto_configure_processing(total_pages)
         
         start_time = time.time()
         
-        images = convert_pdf_to_images(pdf_file_path, config['dpi'], start_page, end_page)
-        
         batch_size = config['batch_size']
-        total_batches = (len(images) + batch_size - 1) // batch_size
+        if pages_per_request is not None:
+            # Groq accepts at most MAX_IMAGES_PER_BATCH images per request
+            batch_size = max(1, min(pages_per_request, MAX_IMAGES_PER_BATCH))
+        total_batches = (pages_to_process + batch_size - 1) // batch_size
         
-        all_results = []
         total_usage = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
         
-        for batch_num in range(total_batches):
+        # pdfium is not thread-safe: render and encode on a single dedicated thread, or
+        # in worker processes when the caller opts in; each worker renders all of its
+        # batches from one document handle, and the pool is shut down off the event loop
+        render_workers = min(render_processes, total_batches)
+        if render_workers > 1:
+            render_pool = ProcessPoolExecutor(
+                max_workers=render_workers, mp_context=_RENDER_MP_CONTEXT,
+                initializer=_init_render_worker, initargs=(pdf_file_path,)
+            )
+        else:
+            render_pool = ThreadPoolExecutor(
+                max_workers=1, initializer=_init_render_worker, initargs=(pdf_file_path, pdf)
+            )
+        stack.push_async_callback(_shutdown_executor, render_pool)
+        
+        # Rendered and encoded batches wait in a bounded queue, so pages are prepared
+        # while earlier batches await the API and only encoded pages stay in memory
+        batch_queue: asyncio.Queue = asyncio.Queue(maxsize=RENDER_PREFETCH_BATCHES)
+        worker_count = max(1, min(max_concurrency, total_batches))
+        
+        # Requests only wait once the per-minute request or token budget is spent; the
+        # budgets are shared with other extractions running on this event loop
+        request_bucket = shared_bucket("qpm", qpm) if qpm else None
+        token_bucket = shared_bucket("tpm", tpm) if tpm else None
+        completed_batches = 0
+        batch_outputs: List[List[Dict[str, Any]]] = [[] for _ in range(total_batches)]
+        
+        def render_batch(batch_num: int) -> asyncio.Future:
+            first_index = start_page - 1 + batch_num * batch_size
+            last_index = min(first_index + batch_size, end_page)
+            return loop.run_in_executor(
+                render_pool, _render_and_encode_range, pdf_file_path, config['dpi'],
+                first_index, last_index, image_quality, max_edge
+            )
+        
+        async def produce_batches():
+            # Keep up to RENDER_PREFETCH_BATCHES renders in flight ahead of the queue
+            pending = deque()
+            try:
+                for batch_num in range(total_batches):
+                    pending.append((batch_num, render_batch(batch_num)))
+                    if len(pending) >= RENDER_PREFETCH_BATCHES:
+                        done_num, render = pending.popleft()
+                        await batch_queue.put((done_num, await render))
+                while pending:
+                    done_num, render = pending.popleft()
+                    await batch_queue.put((done_num, await render))
+            finally:
+                for _ in range(worker_count):
+                    await batch_queue.put(None)
+        
+        async def process_batch(batch_num: int, batch_images: List[str]) -> List[Dict[str, Any]]:
+            nonlocal completed_batches
             batch_start = batch_num * batch_size
-            batch_end = min(batch_start + batch_size, len(images))
-            batch_images = images[batch_start:batch_end]
-            batch_page_numbers = list(range(start_page + batch_start, start_page + batch_end))
+            batch_page_numbers = list(range(start_page + batch_start, start_page + batch_start + len(batch_images)))
             
-            if progress_callback:
-                progress_callback(f"Processing batch {batch_num + 1}/{total_batches}: pages {batch_page_numbers[0]}-{batch_page_numbers[-1]}", 
-                                batch_num + 1, total_batches)
+            # Pages seen earlier in this run or in the page cache are reused; only the rest go to the API
+            cached_results = {}
+            cache_keys = [page_cache_key(image_url, schema_json, cache_context) for image_url in batch_images]
+            lookup = []
+            for page_num, cache_key in zip(batch_page_numbers, cache_keys):
+                cached = run_results.get(cache_key)
+                if cached is not None:
+                    cached_results[page_num] = copy.deepcopy(cached)
+                else:
+                    lookup.append((page_num, cache_key))
+            if page_cache is not None and lookup:
+                stored = await loop.run_in_executor(
+                    cache_pool, page_cache.get_many, [cache_key for _, cache_key in lookup]
+                )
+                for (page_num, _), cached in zip(lookup, stored):
+                    if cached is not None:
+                        cached_results[page_num] = cached
             
-            batch_b64_images = []
-            for img in batch_images:
-                b64_img = encode_image_to_base64(img, IMAGE_FORMAT)
-                batch_b64_images.append(b64_img)
+            request_pages = [
+                (page_num, image_url) for page_num, image_url in zip(batch_page_numbers, batch_images)
+                if page_num not in cached_results
+            ]
             
-            batch_results, batch_usage = await process_batch_with_retry(
-                client, batch_b64_images, schema, batch_num + 1, total_batches, batch_page_numbers
-            )
+            batch_results = []
+            if request_pages:
+                request_page_numbers = [page_num for page_num, _ in request_pages]
+                if request_bucket is not None:
+                    await request_bucket.acquire()
+                if token_bucket is not None:
+                    await token_bucket.acquire(len(request_pages) * IMAGE_TOKEN_ESTIMATE + PROMPT_TOKEN_ESTIMATE)
+                batch_results, batch_usage, returned_pages = await _request_batch(
+                    client, [image_url for _, image_url in request_pages], schema,
+                    batch_num + 1, total_batches, request_page_numbers, cached_schema, validate_page,
+                    prompt_header
+                )
+                
+                # Add explicit page numbers to each result
+                for i, result in enumerate(batch_results):
+                    if i < len(request_page_numbers):
+                        result['page_number'] = request_page_numbers[i]
+                
+                for key in total_usage:
+                    total_usage[key] += batch_usage.get(key, 0)
+                
+                # Only pages the model actually answered are stored, never the placeholders
+                # padding a short response; snapshots keep later changes by callers out
+                keys_by_page = dict(zip(batch_page_numbers, cache_keys))
+                new_entries = []
+                for result in batch_results[:returned_pages]:
+                    if not result.get("error"):
+                        snapshot = copy.deepcopy(result)
+                        cache_key = keys_by_page[result['page_number']]
+                        run_results.setdefault(cache_key, snapshot)
+                        new_entries.append((cache_key, snapshot))
+                if page_cache is not None and new_entries:
+                    await loop.run_in_executor(cache_pool, page_cache.set_many, new_entries)
             
-            # Add explicit page numbers to each result
-            for i, result in enumerate(batch_results):
-                if i < len(batch_page_numbers):
-                    result['page_number'] = batch_page_numbers[i]
+            if cached_results:
+                for page_num, cached in cached_results.items():
+                    cached['page_number'] = page_num
+                batch_results = sorted(
+                    batch_results + list(cached_results.values()),
+                    key=lambda result: result.get('page_number', 0)
+                )
             
-            all_results.extend(batch_results)
+            if page_callback:
+                for result in batch_results:
+                    page_callback(result)
             
-            for key in total_usage:
-                total_usage[key] += batch_usage.get(key, 0)
+            completed_batches += 1
+            if progress_callback:
+                progress_callback(f"Processed batch {batch_num + 1}/{total_batches}: pages {batch_page_numbers[0]}-{batch_page_numbers[-1]}", 
+                                completed_batches, total_batches)
+            else:
+                logger.debug(
+                    "Processed batch %d/%d: pages %d-%d",
+                    batch_num + 1, total_batches, batch_page_numbers[0], batch_page_numbers[-1]
+                )
             
-            if batch_num < total_batches - 1:
-                await asyncio.sleep(RATE_LIMIT_DELAY)
+            return batch_results
+        
+        async def consume_batches():
+            # max_concurrency consumers bound the number of requests in flight
+            while True:
+                item = await batch_queue.get()
+                if item is None:
+                    return
+                batch_num, batch_images = item
+                batch_outputs[batch_num] = await process_batch(batch_num, batch_images)
+        
+        tasks = [asyncio.ensure_future(produce_batches())]
+        tasks += [asyncio.ensure_future(consume_batches()) for _ in range(worker_count)]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+        
+        # Batch outputs are indexed by batch number, so page results stay in page order
+        all_results = [result for batch_results in batch_outputs for result in batch_results]
         
         end_time = time.time()
         processing_time = end_time - start_time
@@ -580,7 +1241,7 @@ async def extract_pdf_async(
             "page_results": all_results,  # Individual page results with page numbers
             "accumulated_data": accumulated_data,
             "processing_stats": {
-                "total_pages": len(images),
+                "total_pages": pages_to_process,
                 "total_batches": total_batches,
                 "batch_size": batch_size,
                 "dpi_used": config['dpi'],
@@ -593,9 +1254,15 @@ async def extract_pdf_async(
             "processing_time_seconds": processing_time,
             "token_usage": total_usage,
             "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
-            "pages_processed": len(images),
-            "batches_used": total_batches
+            "pages_processed": pages_to_process,
+            "batches_used": total_batches,
+            "failed_pages": [result['page_number'] for result in all_results if result.get('error') == 1]
         }
+        logger.info(
+            "Extracted %d pages of %s in %d batches (%.1fs, %d tokens, %d failed pages)",
+            pages_to_process, pdf_file_path, total_batches, processing_time,
+            total_usage["total_tokens"], len(metadata["failed_pages"])
+        )
         
         if save_results:
             if output_filename is None:
@@ -607,12 +1274,42 @@ async def extract_pdf_async(
                 "extraction_results": result
             }
             
-            with open(output_filename, 'w', encoding='utf-8') as f:
-                json.dump(output_data, f, indent=2, ensure_ascii=False)
+            # Encoding a large document is CPU-bound, so keep it off the event loop
+            await loop.run_in_executor(None, write_results_file, output_filename, output_data)
         
         return result, metadata
 
 
+def make_extractor(
+    schema: Optional[Dict[str, Any]] = None, **options: Any
+) -> Callable[..., Awaitable[Tuple[Dict[str, Any], Dict[str, Any]]]]:
+    """
+    Bind a schema and extraction options once for repeated async extractions.
+    
+    The default schema is resolved and the prompt header, cache key text and page
+    validator are built here, once, instead of on every call.
+    
+    Args:
+        schema: JSON schema for extraction (uses default if None)
+        **options: Any other extract_pdf_async keyword arguments
+    
+    Returns:
+        Coroutine function extractor(pdf_file_path, **overrides) returning the same
+        (extraction_results, processing_metadata) tuple as extract_pdf_async
+    """
+    validate_pages = options.pop("validate_pages", False)
+    prepared = _prepare_schema(schema, validate_pages)
+    
+    async def extractor(pdf_file_path: str, **overrides: Any) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        if "schema" in overrides or "validate_pages" in overrides:
+            # A different schema or validation setting needs its own preparation
+            bound = {**options, "schema": prepared.schema, "validate_pages": validate_pages}
+            return await extract_pdf_async(pdf_file_path, **{**bound, **overrides})
+        return await _extract_prepared(pdf_file_path, prepared, **{**options, **overrides})
+    
+    return extractor
+
+
 def extract_pdf(
     pdf_file_path: str,
     schema: Optional[Dict[str, Any]] = None,
@@ -621,7 +1318,18 @@ def extract_pdf(
     progress_callback: Optional[Callable[[str, int, int], None]] = None,
     save_results: bool = False,
     output_filename: Optional[str] = None,
-    api_key: Optional[str] = None
+    api_key: Optional[str] = None,
+    enable_page_cache: bool = False,
+    cached_schema: bool = False,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    qpm: int = DEFAULT_QPM,
+    page_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+    pages_per_request: Optional[int] = None,
+    image_quality: int = DEFAULT_IMAGE_QUALITY,
+    max_edge: int = MAX_IMAGE_DIMENSION,
+    validate_pages: bool = False,
+    tpm: int = DEFAULT_TPM,
+    render_processes: int = 0
 ) -> Dict[str, Any]:
     """
     Extract data from PDF with automatic configuration (synchronous wrapper).
@@ -635,6 +1343,17 @@ def extract_pdf(
         save_results: Whether to save results to JSON file
         output_filename: Custom output filename (auto-generated if None)
         api_key: Groq API key (uses environment/file if None)
+        enable_page_cache: Reuse cached results for previously seen pages
+        cached_schema: Send the schema as a stable system message for prompt-prefix caching
+        max_concurrency: Maximum number of batch requests in flight at once
+        qpm: Maximum request starts per minute
+        page_callback: Function called with each page result as its batch finishes
+        pages_per_request: Pages sent together in one request (size-based default if None)
+        image_quality: Starting JPEG quality for page images
+        max_edge: Longest side in pixels of uploaded page images
+        validate_pages: Validate page results against the schema and retry mismatches
+        tpm: Maximum estimated prompt tokens per minute
+        render_processes: Worker processes to render pages in (0 renders on a thread)
     
     Returns:
         Dictionary containing extraction results and metadata
@@ -649,7 +1368,18 @@ def extract_pdf(
             progress_callback=progress_callback,
             save_results=save_results,
             output_filename=output_filename,
-            api_key=api_key
+            api_key=api_key,
+            enable_page_cache=enable_page_cache,
+            cached_schema=cached_schema,
+            max_concurrency=max_concurrency,
+            qpm=qpm,
+            page_callback=page_callback,
+            pages_per_request=pages_per_request,
+            image_quality=image_quality,
+            max_edge=max_edge,
+            validate_pages=validate_pages,
+            tpm=tpm,
+            render_processes=render_processes
         )
     
     # Always use asyncio.run for better event loop management
@@ -0,0 +1,74 @@
+"""
+Client-side rate limiting for the Groq PDF Vision SDK
+"""
+
+import asyncio
+import time
+import weakref
+from typing import Dict, Optional, Tuple
+
+
+class TokenBucket:
+    """Async token bucket refilled continuously at a per-minute rate."""
+    
+    def __init__(self, rate_per_min: float, capacity: Optional[float] = None):
+        """
+        Create a full bucket.
+        
+        Args:
+            rate_per_min: Tokens added per minute
+            capacity: Most tokens the bucket holds (rate_per_min if None), i.e. the largest burst
+        """
+        self.rate = rate_per_min
+        self.capacity = rate_per_min if capacity is None else capacity
+        self.tokens = self.capacity
+        self.last = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self, cost: float = 1) -> None:
+        """
+        Take cost tokens, sleeping only when the bucket does not hold enough.
+        
+        Callers are served in arrival order; a cost above the capacity waits for
+        the deficit to refill and then empties the bucket.
+        
+        Args:
+            cost: Tokens consumed by the call
+        """
+        async with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate / 60.0)
+            self.last = now
+            if self.tokens < cost:
+                await asyncio.sleep((cost - self.tokens) * 60.0 / self.rate)
+                self.last = time.monotonic()
+                self.tokens = 0.0
+            else:
+                self.tokens -= cost
+
+
+# Buckets shared by every extraction on an event loop, keyed by limit name and rate.
+# asyncio locks cannot be shared across loops, so each loop gets its own set
+_shared_buckets: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[str, float], TokenBucket]]"
+_shared_buckets = weakref.WeakKeyDictionary()
+
+
+def shared_bucket(name: str, rate_per_min: float) -> TokenBucket:
+    """
+    Get the bucket for a named per-minute limit, shared within the running event loop.
+    
+    Concurrent extractions (asyncio.gather, repeated calls to one extractor) that
+    use the same limit draw from one budget instead of each getting the full rate.
+    
+    Args:
+        name: Limit the bucket enforces (e.g. "qpm" or "tpm")
+        rate_per_min: Tokens added per minute; each distinct rate gets its own bucket
+    
+    Returns:
+        The shared TokenBucket, created full on first use
+    """
+    buckets = _shared_buckets.setdefault(asyncio.get_running_loop(), {})
+    bucket = buckets.get((name, rate_per_min))
+    if bucket is None:
+        bucket = buckets[(name, rate_per_min)] = TokenBucket(rate_per_min)
+    return bucket
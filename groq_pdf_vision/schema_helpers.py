@@ -2,7 +2,76 @@
 Schema building helpers for PDF extraction
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, NamedTuple
+
+
+class SchemaField(NamedTuple):
+    """
+    Immutable field definition used while assembling schemas.
+    
+    Builders compose SchemaField instances and only convert them to plain
+    JSON schema dictionaries once, via to_dict().
+    """
+    type: str
+    description: Optional[str] = None
+    items: Optional["SchemaField"] = None
+    properties: Optional[Dict[str, Any]] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the field (and any nested fields) to a JSON schema dictionary."""
+        field = {"type": self.type}
+        if self.items is not None:
+            field["items"] = self.items.to_dict()
+        if self.properties is not None:
+            field["properties"] = {
+                name: value.to_dict() if isinstance(value, SchemaField) else value
+                for name, value in self.properties.items()
+            }
+        # Only a missing description is left out; an empty one is kept as given
+        if self.description is not None:
+            field["description"] = self.description
+        return field
+
+
+_STRING = SchemaField("string")
+_STRING_LIST = SchemaField("array", items=_STRING)
+
+_BASE_FIELDS = {
+    "page_number": SchemaField("integer", "Page number (1-indexed)"),
+    "content": SchemaField("string", "Main text content from the page"),
+    "summary": SchemaField("string", "Brief summary of the page content"),
+    "key_points": SchemaField("array", "Main points and takeaways from the page", items=_STRING),
+}
+
+_IMAGE_FIELDS = {
+    "contains_images": SchemaField("boolean", "Whether page contains images, charts, or diagrams"),
+    "image_descriptions": SchemaField(
+        "array",
+        "Descriptions of visual elements",
+        items=SchemaField("object", properties={
+            "image_type": SchemaField("string", "Type of visual element"),
+            "description": SchemaField("string", "Detailed description"),
+            "location": SchemaField("string", "Location on page"),
+        }),
+    ),
+}
+
+_TABLE_FIELDS = {
+    "contains_tables": SchemaField("boolean", "Whether page contains tables"),
+    "tables_data": SchemaField(
+        "array",
+        "Extracted table data",
+        items=SchemaField("object", properties={
+            "table_title": _STRING,
+            "headers": _STRING_LIST,
+            "rows": SchemaField("array", items=_STRING_LIST),
+        }),
+    ),
+}
+
+_VISUAL_ANALYSIS_FIELDS = {
+    "visual_summary": SchemaField("string", "Overall summary of visual elements on the page"),
+}
 
 
 def create_base_schema(
@@ -24,63 +93,19 @@ def create_base_schema(
     Returns:
         JSON schema dictionary
     """
-    schema = {
-        "type": "object",
-        "properties": {
-            "page_number": {"type": "integer", "description": "Page number (1-indexed)"},
-            "content": {"type": "string", "description": "Main text content from the page"},
-            "summary": {"type": "string", "description": "Brief summary of the page content"},
-            "key_points": {
-                "type": "array",
-                "items": {"type": "string"},
-                "description": "Main points and takeaways from the page"
-            }
-        },
-        "required": ["page_number", "content"]
-    }
+    fields = dict(_BASE_FIELDS)
     
     if include_images:
-        schema["properties"]["contains_images"] = {
-            "type": "boolean", 
-            "description": "Whether page contains images, charts, or diagrams"
-        }
-        schema["properties"]["image_descriptions"] = {
-            "type": "array",
-            "description": "Descriptions of visual elements",
-            "items": {
-                "type": "object",
-                "properties": {
-                    "image_type": {"type": "string", "description": "Type of visual element"},
-                    "description": {"type": "string", "description": "Detailed description"},
-                    "location": {"type": "string", "description": "Location on page"}
-                }
-            }
-        }
+        fields.update(_IMAGE_FIELDS)
     
     if include_tables:
-        schema["properties"]["contains_tables"] = {
-            "type": "boolean", 
-            "description": "Whether page contains tables"
-        }
-        schema["properties"]["tables_data"] = {
-            "type": "array",
-            "description": "Extracted table data",
-            "items": {
-                "type": "object",
-                "properties": {
-                    "table_title": {"type": "string"},
-                    "headers": {"type": "array", "items": {"type": "string"}},
-                    "rows": {"type": "array", "items": {"type": "array", "items": {"type": "string"}}}
-                }
-            }
-        }
+        fields.update(_TABLE_FIELDS)
     
     if include_visual_analysis:
-        schema["properties"]["visual_summary"] = {
-            "type": "string", 
-            "description": "Overall summary of visual elements on the page"
-        }
+        fields.update(_VISUAL_ANALYSIS_FIELDS)
     
+    schema = SchemaField("object", properties=fields).to_dict()
+    schema["required"] = ["page_number", "content"]
     return schema
 
 
@@ -88,6 +113,9 @@ def add_custom_fields(base_schema: Dict[str, Any], custom_fields: Dict[str, Any]
     """
     Add custom fields to an existing schema.
     
+    The base schema is left unchanged, so it can be reused for several
+    extensions.
+    
     Args:
         base_schema: Base schema to extend
         custom_fields: Dictionary of custom field definitions
@@ -95,9 +123,10 @@ def add_custom_fields(base_schema: Dict[str, Any], custom_fields: Dict[str, Any]
     Returns:
         Extended schema
     """
-    extended_schema = base_schema.copy()
-    extended_schema["properties"].update(custom_fields)
-    return extended_schema
+    return {
+        **base_schema,
+        "properties": {**base_schema.get("properties", {}), **custom_fields}
+    }
 
 
 def create_entity_extraction_fields(entity_types: List[str]) -> Dict[str, Any]:
@@ -110,20 +139,17 @@ def create_entity_extraction_fields(entity_types: List[str]) -> Dict[str, Any]:
     Returns:
         Dictionary of entity extraction fields
     """
-    return {
-        "entities": {
-            "type": "array",
-            "description": f"Named entities found: {', '.join(entity_types)}",
-            "items": {
-                "type": "object",
-                "properties": {
-                    "name": {"type": "string", "description": "Entity name"},
-                    "type": {"type": "string", "description": f"Entity type: {', '.join(entity_types)}"},
-                    "context": {"type": "string", "description": "Context where entity appears"}
-                }
-            }
-        }
-    }
+    type_list = ', '.join(entity_types)
+    entities = SchemaField(
+        "array",
+        f"Named entities found: {type_list}",
+        items=SchemaField("object", properties={
+            "name": SchemaField("string", "Entity name"),
+            "type": SchemaField("string", f"Entity type: {type_list}"),
+            "context": SchemaField("string", "Context where entity appears"),
+        }),
+    )
+    return {"entities": entities.to_dict()}
 
 
 def create_list_field(field_name: str, description: str) -> Dict[str, Any]:
@@ -137,13 +163,7 @@ def create_list_field(field_name: str, description: str) -> Dict[str, Any]:
     Returns:
         Field definition
     """
-    return {
-        field_name: {
-            "type": "array",
-            "items": {"type": "string"},
-            "description": description
-        }
-    }
+    return {field_name: SchemaField("array", description, items=_STRING).to_dict()}
 
 
 def create_object_field(field_name: str, properties: Dict[str, Any], description: str) -> Dict[str, Any]:
@@ -158,13 +178,7 @@ def create_object_field(field_name: str, properties: Dict[str, Any], description
     Returns:
         Field definition
     """
-    return {
-        field_name: {
-            "type": "object",
-            "properties": properties,
-            "description": description
-        }
-    }
+    return {field_name: SchemaField("object", description, properties=properties).to_dict()}
 
 
 # Example usage functions for documentation
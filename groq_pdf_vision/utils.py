@@ -2,11 +2,55 @@
 Utility functions for the Groq PDF Vision SDK
 """
 
+import functools
 import json
 import os
-from typing import Dict, Any, Optional, Tuple
+import sys
+import threading
+import warnings
+from collections import deque
+from typing import Any, Callable, Dict, Optional, Tuple, Union
 import pypdfium2 as pdfium
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the stdlib json module
+    orjson = None
+
+try:
+    import fastjsonschema
+except ImportError:  # Optional; compile_page_validator warns and returns None without it
+    fastjsonschema = None
+
+# Cost estimation parameters
+TOKENS_PER_PAGE = 3200  # Average from testing
+COST_PER_TOKEN = 0.00002  # Groq pricing
+
+# Time estimates based on empirical data: (max pages, seconds per page, description)
+_PROCESSING_BUCKETS = (
+    (10, 3, "Small PDF - High quality processing"),
+    (50, 2.5, "Medium PDF - Balanced processing"),
+    (200, 2, "Large PDF - Efficient processing"),
+    (float("inf"), 1.5, "Enterprise PDF - Memory optimized processing"),
+)
+
+# Hundredths of a megabyte per byte, for file sizes reported with 2 decimals
+_MB_X100_PER_BYTE = 100.0 / (1 << 20)
+
+# Field types accepted by validate_schema
+_VALID_TYPE_NAMES = ["string", "integer", "number", "boolean", "array", "object"]
+_VALID_TYPES = frozenset(_VALID_TYPE_NAMES)
+
+# JSON schema type for each Python type produced by json.loads
+_TYPE_MAP = {
+    str: "string",
+    bool: "boolean",
+    int: "integer",
+    float: "number",
+    list: "array",
+    dict: "object",
+}
+
 
 def validate_schema(schema: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
     """
@@ -19,45 +63,16 @@ def validate_schema(schema: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
         Tuple of (is_valid, error_message)
     """
     try:
-        # Basic structure validation
-        if not isinstance(schema, dict):
-            return False, "Schema must be a dictionary"
+        error_msg = _validate_schema_structure(schema)
+        if error_msg:
+            return False, error_msg
         
-        if schema.get("type") != "object":
-            return False, "Schema type must be 'object'"
-        
-        properties = schema.get("properties", {})
-        if not isinstance(properties, dict):
-            return False, "Schema properties must be a dictionary"
-        
-        # Check for required page_number field
-        if "page_number" not in properties:
-            return False, "Schema must include 'page_number' field for page tracking"
-        
-        page_number_field = properties["page_number"]
-        if page_number_field.get("type") != "integer":
-            return False, "page_number field must be of type 'integer'"
-        
-        # Validate each property
-        for field_name, field_def in properties.items():
-            if not isinstance(field_def, dict):
-                return False, f"Field '{field_name}' definition must be a dictionary"
-            
-            field_type = field_def.get("type")
-            if not field_type:
-                return False, f"Field '{field_name}' must have a 'type' property"
-            
-            valid_types = ["string", "integer", "number", "boolean", "array", "object"]
-            if field_type not in valid_types:
-                return False, f"Field '{field_name}' has invalid type '{field_type}'. Must be one of: {valid_types}"
-            
-            # Validate array items
-            if field_type == "array":
-                items = field_def.get("items")
-                if items and isinstance(items, dict):
-                    items_type = items.get("type")
-                    if items_type and items_type not in valid_types:
-                        return False, f"Field '{field_name}' array items have invalid type '{items_type}'"
+        # Validate each property; the helper is bound locally since this runs per field
+        validate_field = _validate_field
+        for field_name, field_def in schema.get("properties", {}).items():
+            error_msg = validate_field(field_name, field_def)
+            if error_msg:
+                return False, error_msg
         
         return True, None
         
@@ -65,7 +80,144 @@ def validate_schema(schema: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
         return False, f"Schema validation error: {str(e)}"
 
 
-def estimate_processing_time(pdf_path: str, start_page: Optional[int] = None, end_page: Optional[int] = None) -> Dict[str, Any]:
+def compile_page_validator(schema: Dict[str, Any]) -> Optional[Callable[[Any], Optional[str]]]:
+    """
+    Compile an extraction schema into a per-page validator, once per run.
+    
+    Args:
+        schema: JSON schema each page result should match
+    
+    Returns:
+        Function returning an error message for an invalid page (None if valid), or None
+        when fastjsonschema is not installed or cannot compile the schema (with a
+        RuntimeWarning, shown once per process by the default warning filters)
+    """
+    if fastjsonschema is None:
+        warnings.warn(
+            "Page validation needs fastjsonschema (pip install groq-pdf-vision[fast]); "
+            "page results will not be validated",
+            RuntimeWarning, stacklevel=2
+        )
+        return None
+    try:
+        compiled = fastjsonschema.compile(schema)
+    except Exception as e:
+        warnings.warn(
+            f"Could not compile the schema for page validation ({e}); "
+            "page results will not be validated",
+            RuntimeWarning, stacklevel=2
+        )
+        return None
+    
+    def validate_page(page: Any) -> Optional[str]:
+        try:
+            compiled(page)
+        except fastjsonschema.JsonSchemaException as e:
+            return e.message
+        return None
+    
+    return validate_page
+
+
+def _validate_schema_structure(schema: Dict[str, Any]) -> Optional[str]:
+    """Check the top-level shape of a schema; returns an error message or None."""
+    # Basic structure validation
+    if not isinstance(schema, dict):
+        return "Schema must be a dictionary"
+    
+    if schema.get("type") != "object":
+        return "Schema type must be 'object'"
+    
+    properties = schema.get("properties", {})
+    if not isinstance(properties, dict):
+        return "Schema properties must be a dictionary"
+    
+    # Check for required page_number field
+    if "page_number" not in properties:
+        return "Schema must include 'page_number' field for page tracking"
+    
+    page_number_field = properties["page_number"]
+    if page_number_field.get("type") != "integer":
+        return "page_number field must be of type 'integer'"
+    
+    return None
+
+
+def _validate_field(field_name: str, field_def: Dict[str, Any]) -> Optional[str]:
+    """Check a single property definition; returns an error message or None."""
+    if not isinstance(field_def, dict):
+        return f"Field '{field_name}' definition must be a dictionary"
+    
+    valid_types = _VALID_TYPES
+    field_type = field_def.get("type")
+    if not field_type:
+        return f"Field '{field_name}' must have a 'type' property"
+    
+    # Only string type names can be valid; a list such as ["string", "null"] is unhashable
+    if not (isinstance(field_type, str) and field_type in valid_types):
+        return f"Field '{field_name}' has invalid type '{field_type}'. Must be one of: {_VALID_TYPE_NAMES}"
+    
+    # Validate array items; only arrays need the extra lookups
+    items = field_def.get("items") if field_type == "array" else None
+    if items and isinstance(items, dict):
+        items_type = items.get("type")
+        if items_type and not (isinstance(items_type, str) and items_type in valid_types):
+            return f"Field '{field_name}' array items have invalid type '{items_type}'"
+    
+    return None
+
+
+# pdfium may not be called from two threads at once, even for different documents;
+# every call into it, from this module or from rendering in core, takes this lock
+_PDFIUM_LOCK = threading.Lock()
+
+
+def _open_document(pdf_path: str) -> Tuple[pdfium.PdfDocument, int]:
+    """Open a PDF and count its pages while holding the pdfium lock."""
+    with _PDFIUM_LOCK:
+        pdf = pdfium.PdfDocument(pdf_path)
+        return pdf, len(pdf)
+
+
+def _close_document(pdf: pdfium.PdfDocument) -> None:
+    """Close a PDF while holding the pdfium lock."""
+    with _PDFIUM_LOCK:
+        pdf.close()
+
+
+@functools.lru_cache(maxsize=128)
+def _pdf_page_count(pdf_path: str, mtime: float, size: int) -> int:
+    """Open a PDF and return its page count (memoized on path, mtime and size)."""
+    pdf, page_count = _open_document(pdf_path)
+    _close_document(pdf)
+    return page_count
+
+
+def get_pdf_page_count(pdf_path: str, stat_result: Optional[os.stat_result] = None) -> int:
+    """
+    Get the number of pages in a PDF, reusing the count from earlier calls.
+    
+    The count is cached per (path, modification time, size), so calling this
+    repeatedly for an unchanged file parses the PDF only once.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        stat_result: Result of os.stat(pdf_path), if the caller already has it
+    
+    Returns:
+        Number of pages in the PDF
+    """
+    if stat_result is None:
+        stat_result = os.stat(pdf_path)
+    return _pdf_page_count(pdf_path, stat_result.st_mtime, stat_result.st_size)
+
+
+def estimate_processing_time(
+    pdf_path: str,
+    start_page: Optional[int] = None,
+    end_page: Optional[int] = None,
+    stat_result: Optional[os.stat_result] = None
+) -> Dict[str, Any]:
     """
     Estimate processing time and cost for a PDF.
     
@@ -73,14 +225,13 @@ def estimate_processing_time(pdf_path: str, start_page: Optional[int] = None, en
         pdf_path: Path to the PDF file
         start_page: Start page number (1-indexed, optional)
         end_page: End page number (1-indexed, optional)
+        stat_result: Result of os.stat(pdf_path), if the caller already has it
     
     Returns:
         Dictionary with time and cost estimates
     """
     try:
-        pdf = pdfium.PdfDocument(pdf_path)
-        total_pages = len(pdf)
-        pdf.close()
+        total_pages = get_pdf_page_count(pdf_path, stat_result)
         
         if start_page is None:
             start_page = 1
@@ -89,27 +240,15 @@ def estimate_processing_time(pdf_path: str, start_page: Optional[int] = None, en
         
         pages_to_process = end_page - start_page + 1
         
-        # Time estimates based on empirical data
-        if pages_to_process <= 10:
-            time_per_page = 3  # seconds
-            description = "Small PDF - High quality processing"
-        elif pages_to_process <= 50:
-            time_per_page = 2.5  # seconds
-            description = "Medium PDF - Balanced processing"
-        elif pages_to_process <= 200:
-            time_per_page = 2  # seconds
-            description = "Large PDF - Efficient processing"
-        else:
-            time_per_page = 1.5  # seconds
-            description = "Enterprise PDF - Memory optimized processing"
+        time_per_page, description = next(
+            (tpp, desc) for max_pages, tpp, desc in _PROCESSING_BUCKETS
+            if pages_to_process <= max_pages
+        )
         
         estimated_time = pages_to_process * time_per_page
         
         # Cost estimates (based on average token usage)
-        tokens_per_page = 3200  # Average from testing
-        total_tokens = pages_to_process * tokens_per_page
-        cost_per_token = 0.00002  # Groq pricing
-        estimated_cost = total_tokens * cost_per_token
+        total_tokens, estimated_cost, cost_per_page = _cost_breakdown(pages_to_process, TOKENS_PER_PAGE)
         
         return {
             "total_pages_in_pdf": total_pages,
@@ -119,7 +258,7 @@ def estimate_processing_time(pdf_path: str, start_page: Optional[int] = None, en
             "estimated_tokens": total_tokens,
             "estimated_cost_usd": estimated_cost,
             "processing_description": description,
-            "cost_per_page": estimated_cost / pages_to_process
+            "cost_per_page": cost_per_page
         }
         
     except Exception as e:
@@ -128,7 +267,7 @@ def estimate_processing_time(pdf_path: str, start_page: Optional[int] = None, en
         }
 
 
-def estimate_cost(pages: int, tokens_per_page: int = 3200) -> Dict[str, float]:
+def estimate_cost(pages: int, tokens_per_page: int = TOKENS_PER_PAGE) -> Dict[str, float]:
     """
     Estimate processing cost for a given number of pages.
     
@@ -139,20 +278,30 @@ def estimate_cost(pages: int, tokens_per_page: int = 3200) -> Dict[str, float]:
     Returns:
         Dictionary with cost breakdown
     """
-    total_tokens = pages * tokens_per_page
-    cost_per_token = 0.00002  # Groq pricing
-    total_cost = total_tokens * cost_per_token
+    total_tokens, total_cost, cost_per_page = _cost_breakdown(pages, tokens_per_page)
     
     return {
         "pages": pages,
         "tokens_per_page": tokens_per_page,
         "total_tokens": total_tokens,
-        "cost_per_token": cost_per_token,
+        "cost_per_token": COST_PER_TOKEN,
         "total_cost_usd": total_cost,
-        "cost_per_page": total_cost / pages
+        "cost_per_page": cost_per_page
     }
 
 
+@functools.lru_cache(maxsize=256)
+def _cost_breakdown(pages: int, tokens_per_page: int) -> Tuple[int, float, float]:
+    """Return (total_tokens, total_cost, cost_per_page) for a page count (memoized)."""
+    total_tokens = pages * tokens_per_page
+    total_cost = total_tokens * COST_PER_TOKEN
+    return total_tokens, total_cost, total_cost / pages
+
+
+# (seconds per unit, unit name), largest unit first
+_DURATION_UNITS = ((3600.0, "hours"), (60.0, "minutes"))
+
+
 def format_duration(seconds: float) -> str:
     """
     Format duration in seconds to human-readable string.
@@ -163,14 +312,50 @@ def format_duration(seconds: float) -> str:
     Returns:
         Formatted duration string
     """
-    if seconds < 60:
-        return f"{seconds:.1f} seconds"
-    elif seconds < 3600:
-        minutes = seconds / 60
-        return f"{minutes:.1f} minutes"
-    else:
-        hours = seconds / 3600
-        return f"{hours:.1f} hours"
+    for unit_seconds, unit_name in _DURATION_UNITS:
+        if seconds >= unit_seconds:
+            return f"{seconds / unit_seconds:.1f} {unit_name}"
+    return f"{seconds:.1f} seconds"
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse JSON from bytes or text, using orjson when it is installed.
+    
+    Args:
+        data: JSON document, as UTF-8 bytes or str
+    
+    Returns:
+        Parsed Python object
+    
+    Raises:
+        json.JSONDecodeError: If the data is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 JSON bytes, using orjson when it is installed.
+    
+    Args:
+        obj: JSON-serializable object
+        indent: Whether to pretty-print with a 2-space indent
+    
+    Returns:
+        UTF-8 encoded JSON document
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
 
 
 def load_schema_from_file(schema_path: str) -> Dict[str, Any]:
@@ -190,8 +375,8 @@ def load_schema_from_file(schema_path: str) -> Dict[str, Any]:
     if not os.path.exists(schema_path):
         raise FileNotFoundError(f"Schema file not found: {schema_path}")
     
-    with open(schema_path, 'r', encoding='utf-8') as f:
-        schema = json.load(f)
+    with open(schema_path, 'rb') as f:
+        schema = json_loads(f.read())
     
     # Validate the loaded schema
     is_valid, error_msg = validate_schema(schema)
@@ -201,50 +386,53 @@ def load_schema_from_file(schema_path: str) -> Dict[str, Any]:
     return schema
 
 
-def save_schema_to_file(schema: Dict[str, Any], output_path: str) -> None:
+def save_schema_to_file(schema: Dict[str, Any], output_path: str, *, skip_validation: bool = False) -> None:
     """
     Save a schema dictionary to a JSON file.
     
     Args:
         schema: Schema dictionary to save
         output_path: Path where to save the schema file
+        skip_validation: Skip validation when the schema is already known to be
+            valid (e.g. it came from load_schema_from_file or merge_schemas)
     
     Raises:
         ValueError: If schema is invalid
     """
     # Validate schema before saving
-    is_valid, error_msg = validate_schema(schema)
-    if not is_valid:
-        raise ValueError(f"Cannot save invalid schema: {error_msg}")
+    if not skip_validation:
+        is_valid, error_msg = validate_schema(schema)
+        if not is_valid:
+            raise ValueError(f"Cannot save invalid schema: {error_msg}")
     
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(schema, f, indent=2, ensure_ascii=False)
+    with open(output_path, 'wb') as f:
+        f.write(json_dumps(schema, indent=True))
 
 
-def get_pdf_info(pdf_path: str) -> Dict[str, Any]:
+def get_pdf_info(pdf_path: str, stat_result: Optional[os.stat_result] = None) -> Dict[str, Any]:
     """
     Get basic information about a PDF file.
     
     Args:
         pdf_path: Path to the PDF file
+        stat_result: Result of os.stat(pdf_path), if the caller already has it
     
     Returns:
         Dictionary with PDF information
     """
     try:
-        pdf = pdfium.PdfDocument(pdf_path)
-        total_pages = len(pdf)
+        if stat_result is None:
+            stat_result = os.stat(pdf_path)
+        total_pages = get_pdf_page_count(pdf_path, stat_result)
         
-        # Get file size
-        file_size = os.path.getsize(pdf_path)
-        file_size_mb = file_size / (1024 * 1024)
-        
-        pdf.close()
+        # Get file size, in MB rounded to 2 decimal places
+        file_size = stat_result.st_size
+        file_size_mb = int(file_size * _MB_X100_PER_BYTE + 0.5) / 100
         
         return {
             "file_path": pdf_path,
             "file_size_bytes": file_size,
-            "file_size_mb": round(file_size_mb, 2),
+            "file_size_mb": file_size_mb,
             "total_pages": total_pages,
             "can_process": True
         }
@@ -261,6 +449,9 @@ def create_progress_callback(verbose: bool = True):
     """
     Create a progress callback function for PDF processing.
     
+    Each update is written to stdout in a single call and flushed at once, so
+    nothing is held back if processing stops early.
+    
     Args:
         verbose: Whether to print detailed progress information
     
@@ -270,7 +461,8 @@ def create_progress_callback(verbose: bool = True):
     def progress_callback(message: str, current: int, total: int):
         if verbose:
             percentage = (current / total) * 100
-            print(f"Progress: {percentage:.1f}% ({current}/{total}) - {message}")
+            sys.stdout.write(f"Progress: {percentage:.1f}% ({current}/{total}) - {message}\n")
+            sys.stdout.flush()
     
     return progress_callback
 
@@ -279,6 +471,10 @@ def merge_schemas(base_schema: Dict[str, Any], additional_fields: Dict[str, Any]
     """
     Merge additional fields into a base schema.
     
+    The base schema is not modified. Its existing fields are assumed to be
+    valid already, so only the structure and the newly added fields are
+    validated.
+    
     Args:
         base_schema: Base schema to extend
         additional_fields: Additional field definitions to add
@@ -286,21 +482,37 @@ def merge_schemas(base_schema: Dict[str, Any], additional_fields: Dict[str, Any]
     Returns:
         Merged schema dictionary
     """
-    merged_schema = base_schema.copy()
-    
-    if "properties" not in merged_schema:
-        merged_schema["properties"] = {}
+    merged_schema = {
+        **base_schema,
+        "properties": {**base_schema.get("properties", {}), **additional_fields}
+    }
     
-    merged_schema["properties"].update(additional_fields)
+    # Validate only what the merge could have changed
+    try:
+        error_msg = _validate_schema_structure(merged_schema)
+        for field_name, field_def in additional_fields.items():
+            error_msg = error_msg or _validate_field(field_name, field_def)
+    except Exception as e:
+        error_msg = f"Schema validation error: {str(e)}"
     
-    # Validate the merged schema
-    is_valid, error_msg = validate_schema(merged_schema)
-    if not is_valid:
+    if error_msg:
         raise ValueError(f"Merged schema is invalid: {error_msg}")
     
     return merged_schema
 
 
+def _infer_type(value: Any) -> str:
+    """Map a Python value to its JSON schema type name."""
+    field_type = _TYPE_MAP.get(type(value))
+    if field_type is None:
+        # Subclasses of the builtin types (e.g. OrderedDict) miss the exact lookup
+        field_type = next(
+            (name for python_type, name in _TYPE_MAP.items() if isinstance(value, python_type)),
+            "string"
+        )
+    return field_type
+
+
 def extract_schema_from_example(example_output: Dict[str, Any]) -> Dict[str, Any]:
     """
     Generate a schema from an example output structure.
@@ -311,51 +523,46 @@ def extract_schema_from_example(example_output: Dict[str, Any]) -> Dict[str, Any
     Returns:
         Generated schema dictionary
     """
-    def infer_type(value):
-        if isinstance(value, str):
-            return "string"
-        elif isinstance(value, int):
-            return "integer"
-        elif isinstance(value, float):
-            return "number"
-        elif isinstance(value, bool):
-            return "boolean"
-        elif isinstance(value, list):
-            return "array"
-        elif isinstance(value, dict):
-            return "object"
-        else:
-            return "string"
-    
-    properties = {}
-    
-    for field_name, field_value in example_output.items():
-        field_type = infer_type(field_value)
-        field_def = {"type": field_type}
-        
-        if field_type == "array" and field_value:
-            # Infer array item type from first element
-            first_item = field_value[0]
-            item_type = infer_type(first_item)
-            field_def["items"] = {"type": item_type}
-            
-            if item_type == "object" and isinstance(first_item, dict):
-                # Recursively generate schema for object items
-                field_def["items"] = extract_schema_from_example(first_item)
-        
-        elif field_type == "object":
-            # Recursively generate schema for nested objects
-            field_def = extract_schema_from_example(field_value)
-        
-        properties[field_name] = field_def
-    
     schema = {
         "type": "object",
-        "properties": properties
+        "properties": {}
     }
     
-    # Ensure page_number is included
-    if "page_number" not in properties:
-        schema["properties"]["page_number"] = {"type": "integer", "description": "Page number (1-indexed)"}
+    # Walk nested objects breadth-first with a worklist instead of recursion so
+    # deeply nested examples don't hit the interpreter's recursion limit
+    pending = deque([(schema["properties"], example_output)])
     
-    return schema 
\ No newline at end of file
+    while pending:
+        properties, example = pending.popleft()
+        
+        for field_name, field_value in example.items():
+            # Exact-type lookup covers everything json.loads produces; only
+            # subclasses (or non-JSON values) take the slower _infer_type path
+            field_type = _TYPE_MAP.get(type(field_value)) or _infer_type(field_value)
+            
+            if field_type == "object":
+                # Nested objects get their own generated schema
+                field_def = {"type": "object", "properties": {}}
+                pending.append((field_def["properties"], field_value))
+            else:
+                field_def = {"type": field_type}
+                
+                if field_type == "array" and field_value:
+                    # Infer array item type from first element
+                    first_item = field_value[0]
+                    item_type = _TYPE_MAP.get(type(first_item)) or _infer_type(first_item)
+                    
+                    if item_type == "object":
+                        items_def = {"type": "object", "properties": {}}
+                        pending.append((items_def["properties"], first_item))
+                    else:
+                        items_def = {"type": item_type}
+                    field_def["items"] = items_def
+            
+            properties[field_name] = field_def
+        
+        # Ensure page_number is included
+        if "page_number" not in properties:
+            properties["page_number"] = {"type": "integer", "description": "Page number (1-indexed)"}
+    
+    return schema
@@ -0,0 +1,167 @@
+"""
+Shared helpers for the Groq PDF Vision test scripts
+"""
+
+import functools
+import hashlib
+import json
+import os
+import struct
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from groq_pdf_vision import extract_pdf_async
+from groq_pdf_vision.core import GROQ_MODEL_ID, PROMPT_VERSION
+from groq_pdf_vision.utils import json_dumps, json_loads
+
+# Repository paths, resolved once at import
+REPO_ROOT = Path(__file__).resolve().parent.parent
+EXAMPLE_DOCS = REPO_ROOT / "example_docs"
+
+# Extraction results from earlier runs, keyed by the inputs that produced them
+CACHE_DIR = Path(__file__).resolve().parent / ".cache"
+
+@functools.lru_cache(maxsize=None)
+def load_schema(path):
+    """Read and parse a JSON schema file once per process (orjson when installed)"""
+    return json_loads(Path(path).read_bytes())
+
+def extraction_cache_key(pdf_path, schema, schema_hash=None):
+    """Hash the PDF bytes, schema, model and prompt version into a cache key
+    
+    Each part is preceded by its 8-byte length so different splits of the same
+    bytes can never produce the same digest. A precomputed schema_hash is used
+    in place of re-serializing the schema.
+    """
+    if schema_hash is None:
+        schema_hash = hashlib.sha256(json.dumps(schema, sort_keys=True, separators=(",", ":")).encode()).hexdigest()
+    parts = (
+        Path(pdf_path).read_bytes(),
+        schema_hash.encode(),
+        GROQ_MODEL_ID.encode(),
+        str(PROMPT_VERSION).encode(),
+    )
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(struct.pack(">Q", len(part)))
+        digest.update(part)
+    return digest.hexdigest()
+
+def _load_cached(path):
+    """Return the cached (result, metadata) at path, or None if missing, malformed or partly failed"""
+    try:
+        data = json_loads(path.read_bytes())
+        result = data["extraction_results"]
+        metadata = data["processing_metadata"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    if not isinstance(result.get("page_results"), list) or "pages_processed" not in metadata:
+        return None
+    # Never replay failed pages, including from entries written before failed runs were skipped
+    if metadata.get("failed_pages"):
+        return None
+    return result, metadata
+
+async def cached_extract(pdf_path, schema, schema_hash=None, extract=extract_pdf_async, **kwargs):
+    """Run an extraction, reusing the stored result for identical inputs
+    
+    extract is extract_pdf_async or an extractor from make_extractor.
+    Set GROQ_PDF_NO_CACHE=1 to force a fresh extraction.
+    
+    Returns:
+        Tuple of (result, metadata, from_cache)
+    """
+    cache_file = CACHE_DIR / f"{extraction_cache_key(pdf_path, schema, schema_hash)}.json"
+    if os.environ.get("GROQ_PDF_NO_CACHE") != "1":
+        cached = _load_cached(cache_file)
+        if cached is not None:
+            # Replay stored pages so streaming callers see the same calls as a live run
+            page_callback = kwargs.get("page_callback")
+            if page_callback:
+                for page in cached[0]["page_results"]:
+                    page_callback(page)
+            return (*cached, True)
+    
+    result, metadata = await extract(str(pdf_path), schema=schema, **kwargs)
+    
+    # A transient API failure must not be replayed by every later run
+    if metadata.get("failed_pages"):
+        return result, metadata, False
+    
+    # Write to a temp file and rename so concurrent workers never read a partial entry
+    CACHE_DIR.mkdir(exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(json_dumps({"processing_metadata": metadata, "extraction_results": result}))
+        os.replace(tmp_path, cache_file)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return result, metadata, False
+
+# Minimum seconds between progress lines; the final update always prints
+PROGRESS_INTERVAL = 2.0
+
+def make_progress_cb(show_eta=False, every=PROGRESS_INTERVAL, overwrite=False):
+    """Build a progress_callback(message, current, total) that prints at most one line per interval
+    
+    With overwrite=True each update rewrites the same terminal line via a carriage
+    return, and the final update ends it with a newline.
+    """
+    start_time = time.monotonic()
+    last_print = None
+    
+    def progress_callback(message, current, total):
+        nonlocal last_print
+        now = time.monotonic()
+        if current < total and last_print is not None and now - last_print < every:
+            return
+        last_print = now
+        
+        percentage = current * 100.0 / total
+        if show_eta and current > 0:
+            # ETA from the average time per update so far: elapsed * remaining / done
+            elapsed = now - start_time
+            line = (
+                f"🔄 [{current}/{total}] ({percentage:.1f}%) {message} | "
+                f"⏱️ Elapsed: {elapsed:.1f}s | ETA: {elapsed * (total - current) / current:.1f}s"
+            )
+        else:
+            line = f"🔄 [{current}/{total}] ({percentage:.1f}%) {message}"
+        
+        if overwrite:
+            sys.stdout.write(f"\r{line}" + ("\n" if current >= total else ""))
+            sys.stdout.flush()
+        else:
+            sys.stdout.write(f"{line}\n")
+    
+    return progress_callback
+
+def image_description(image):
+    """Return an image description as text (pages report either strings or objects)"""
+    if isinstance(image, str):
+        return image
+    if isinstance(image, dict):
+        return image.get("description", str(image))
+    return str(image)
+
+def format_sample_pages(page_results, count=3):
+    """Format a content preview of the first few page results as one block of text"""
+    lines = ['\n📊 Sample extracted content from first few pages:']
+    for i, page in enumerate(page_results[:count]):
+        lines.append(f'\n--- Page {i+1} ---')
+        lines.append(f'Content preview: {page.get("content", "")[:200]}...')
+        
+        images = page.get("image_descriptions", []) if page.get("contains_images") else []
+        if images:
+            lines.append(f'Images detected: {len(images)} image(s)')
+            lines.append(f'First image: {image_description(images[0])[:100]}...')
+        
+        # Show any extracted entities
+        entities = page.get("entities")
+        if isinstance(entities, list) and entities:
+            lines.append(f'Entities found: {", ".join(str(e) for e in entities[:3])}')
+    return "\n".join(lines)
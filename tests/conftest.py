@@ -0,0 +1,23 @@
+"""
+Shared pytest configuration for the Groq PDF Vision test suite
+"""
+
+import os
+
+import pytest
+
+def pytest_configure(config):
+    """Stop early without pytest-asyncio, which runs the async def tests (asyncio_mode = "auto")"""
+    if not config.pluginmanager.hasplugin("asyncio"):
+        raise pytest.UsageError(
+            "pytest-asyncio is required to run the test suite: pip install -e \".[test]\""
+        )
+
+def pytest_collection_modifyitems(config, items):
+    """Skip the tests marked groq_api when no Groq API key is set; the rest still run"""
+    if os.environ.get("GROQ_API_KEY"):
+        return
+    skip_api = pytest.mark.skip(reason="GROQ_API_KEY environment variable not set")
+    for item in items:
+        if "groq_api" in item.keywords:
+            item.add_marker(skip_api)
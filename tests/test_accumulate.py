@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Offline tests for merging page results into one document result (no API key needed)
+"""
+
+import copy
+
+from groq_pdf_vision.core import accumulate_results
+
+# Pages mixing every field kind the merge treats differently: text, lists (with
+# duplicates, example data and equal-but-differently-typed items), tables, booleans,
+# counters, other numbers, objects and a field that first appears on a later page
+PAGES = [
+    {
+        "page_number": 1, "content": "Revenue grew.", "name": "Page 1", "result": "Summary 1",
+        "custom_content": "", "error": 0, "item_count": 2, "confidence": 0.9, "contains_tables": False,
+        "key_terms": ["revenue", "example1", "Placeholder term", "margin", 1, None],
+        "tables_data": [
+            {"table_title": "Revenue by region", "headers": ["Region", "Q1"], "rows": [["EU", "4"]]},
+            {"table_title": "Example table", "headers": ["A"], "rows": []},
+        ],
+        "explicit_pages": [1, 3], "visual_summary": "Bar chart", "metadata": {"source": "p1"},
+    },
+    {
+        "page_number": 2, "content": "", "name": "Page 2", "result": "", "custom_content": "Note 2",
+        "error": 1, "item_count": 3, "confidence": 0.4, "contains_tables": True,
+        "key_terms": ["margin", "actual_item_1", True, 1.0, "costs"],
+        "tables_data": [
+            {"table_title": "Revenue by region", "headers": ["Region", "Q1"], "rows": [["EU", "4"]]},
+            {"table_title": "Headcount", "headers": [], "rows": [["12"]]},
+            {"table_title": "", "headers": ["X"], "rows": []},
+        ],
+        "explicit_pages": [3, 2], "visual_summary": "", "metadata": {"source": "p2"},
+    },
+    {
+        "page_number": 3, "content": "Costs fell.", "name": "", "result": "Summary 3",
+        "custom_content": "Note 3", "error": 0, "item_count": 1, "confidence": 0.0, "contains_tables": False,
+        "key_terms": [], "tables_data": [],
+        "explicit_pages": [3], "visual_summary": "Line chart", "metadata": {"source": "p3"},
+        "appendix": ["late field"],
+    },
+]
+
+# What the original field-by-field merge produced for PAGES
+EXPECTED = {
+    # Non-empty content joined with spaces
+    "content": "Revenue grew. Costs fell.",
+    # Later non-empty name and result become combined descriptions
+    "name": "Accumulated Pages 1-3",
+    "result": "Accumulated analysis of 3 pages",
+    # The first non-empty custom_content wins
+    "custom_content": "Note 2",
+    # error is the worst page's value
+    "error": 1,
+    # Counters add every page onto the first page's value, which is counted twice
+    "item_count": 8,
+    # Other numbers keep the first page's value
+    "confidence": 0.9,
+    # Booleans are OR-ed
+    "contains_tables": True,
+    # Unique items in first-seen order; 1, 1.0 and True are one item, example data and falsy items are dropped
+    "key_terms": ["revenue", "margin", 1, "costs"],
+    # Tables need a real title and some headers or rows
+    "tables_data": [
+        {"table_title": "Revenue by region", "headers": ["Region", "Q1"], "rows": [["EU", "4"]]},
+        {"table_title": "Headcount", "headers": [], "rows": [["12"]]},
+    ],
+    # Page lists are sorted and deduplicated
+    "explicit_pages": [1, 2, 3],
+    # The first non-empty summary stays, and every non-empty one is collected
+    "visual_summary": "Bar chart",
+    # Objects keep the first page's value
+    "metadata": {"source": "p1"},
+    "visual_summaries": ["Bar chart", "Line chart"],
+    # A field missing from the first page takes the first value seen
+    "appendix": ["late field"],
+}
+
+def test_accumulate_matches_the_original_merge():
+    """Every field kind merges to the same values, in the same key order, as before"""
+    result = accumulate_results(copy.deepcopy(PAGES))
+    assert result == EXPECTED
+    assert list(result) == list(EXPECTED)
+
+def test_accumulate_leaves_page_results_unchanged():
+    """Merging does not modify the page results it reads"""
+    pages = copy.deepcopy(PAGES)
+    accumulate_results(pages)
+    assert pages == PAGES
+
+def test_accumulate_single_page_and_empty_input():
+    """One page merges to its own fields minus page_number; no pages merge to an empty result"""
+    page = copy.deepcopy(PAGES[0])
+    result = accumulate_results([page])
+    assert result["content"] == "Revenue grew."
+    assert result["key_terms"] == ["revenue", "margin", 1]
+    assert result["item_count"] == 4
+    assert "page_number" not in result
+    assert accumulate_results([]) == {}
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+Test CLI commands from README
+"""
+
+import pytest
+
+from groq_pdf_vision.cli import cli_main
+from _helpers import EXAMPLE_DOCS, REPO_ROOT
+
+# Get file paths relative to the tests directory
+EXAMPLE_PDF = str(EXAMPLE_DOCS / "example.pdf")
+TEST_SCHEMA = str(REPO_ROOT / "tests" / "test_schema.json")
+
+# One case per command so pytest-xdist can schedule them independently
+CLI_TESTS = [
+    pytest.param(
+        [EXAMPLE_PDF, "--start-page", "1", "--end-page", "1", "--quiet"],
+        id="basic-processing", marks=pytest.mark.groq_api
+    ),
+    pytest.param([EXAMPLE_PDF, "--info-only"], id="info-only"),
+    pytest.param(["--validate-schema", TEST_SCHEMA], id="validate-schema"),
+]
+
+@pytest.mark.parametrize("args", CLI_TESTS)
+def test_cli_command(args):
+    """Run a groq-pdf command in-process and check that it exits cleanly"""
+    returncode = cli_main(args)
+    assert returncode == 0, f"groq-pdf {' '.join(args)} exited with code {returncode}"
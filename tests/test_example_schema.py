@@ -3,34 +3,42 @@
 Test example schema usage from README
 """
 
-import os
-import json
-import sys
-from pathlib import Path
-
-# Add parent directory to path so we can import the package
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
 
 from groq_pdf_vision import extract_pdf
 from groq_pdf_vision.schema_helpers import create_base_schema, add_custom_fields
+from _helpers import EXAMPLE_DOCS, load_schema
 
-# Check for API key - fail fast if not available
-if not os.environ.get("GROQ_API_KEY"):
-    print("❌ ERROR: GROQ_API_KEY environment variable not set")
-    print("   Please set your Groq API key: export GROQ_API_KEY='your-key-here'")
-    sys.exit(1)
+# Every test in this module calls the Groq API
+pytestmark = pytest.mark.groq_api
 
 # Get file paths relative to the tests directory
-EXAMPLE_PDF = str(Path(__file__).parent.parent / "example_docs" / "example.pdf")
-EXAMPLE_SCHEMA = str(Path(__file__).parent.parent / "example_docs" / "example_custom_schema.json")
+EXAMPLE_PDF = str(EXAMPLE_DOCS / "example.pdf")
+EXAMPLE_SCHEMA = str(EXAMPLE_DOCS / "example_custom_schema.json")
+
+# Method 2 schema (base schema plus custom fields), built once at import
+METHOD2_SCHEMA = add_custom_fields(create_base_schema(), {
+    "document_type": {
+        "type": "string", 
+        "description": "Type of document (financial, technical, academic, etc.)"
+    },
+    "key_findings": {
+        "type": "array", 
+        "items": {"type": "string"}, 
+        "description": "Most important findings or insights from this page"
+    },
+    "sentiment": {
+        "type": "string", 
+        "description": "Overall sentiment of the page content"
+    }
+})
 
 def test_example_schema_method1():
     """Test Method 1: Load JSON Schema Directly"""
     print("🧪 Testing Method 1: Load JSON Schema Directly...")
     
     # Load the example schema
-    with open(EXAMPLE_SCHEMA, 'r') as f:
-        schema = json.load(f)
+    schema = load_schema(EXAMPLE_SCHEMA)
 
     # Use it for extraction
     result = extract_pdf(EXAMPLE_PDF, start_page=1, end_page=1, schema=schema)
@@ -42,29 +50,8 @@ def test_example_schema_method2():
     """Test Method 2: Build with Schema Helpers (Recommended)"""
     print("🧪 Testing Method 2: Build with Schema Helpers...")
     
-    # Start with the base schema
-    base = create_base_schema()
-
-    # Add your custom fields
-    custom_fields = {
-        "document_type": {
-            "type": "string", 
-            "description": "Type of document (financial, technical, academic, etc.)"
-        },
-        "key_findings": {
-            "type": "array", 
-            "items": {"type": "string"}, 
-            "description": "Most important findings or insights from this page"
-        },
-        "sentiment": {
-            "type": "string", 
-            "description": "Overall sentiment of the page content"
-        }
-    }
-
-    # Combine them
-    schema = add_custom_fields(base, custom_fields)
-    result = extract_pdf(EXAMPLE_PDF, start_page=1, end_page=1, schema=schema)
+    # Base schema combined with the custom fields
+    result = extract_pdf(EXAMPLE_PDF, start_page=1, end_page=1, schema=METHOD2_SCHEMA)
     
     print(f"✅ Method 2 works - processed {len(result['page_results'])} page(s)")
     print("✅ Method 2 - PASSED\n")
@@ -5,26 +5,35 @@ Test Flask integration example from README
 
 import os
 import asyncio
+import contextlib
 import tempfile
 import shutil
-import sys
-from pathlib import Path
 
-# Add parent directory to path so we can import the package
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
 
+from groq import AsyncGroq
 from groq_pdf_vision import extract_pdf_async
+from _helpers import EXAMPLE_DOCS
 
-# Check for API key - fail fast if not available
-if not os.environ.get("GROQ_API_KEY"):
-    print("❌ ERROR: GROQ_API_KEY environment variable not set")
-    print("   Please set your Groq API key: export GROQ_API_KEY='your-key-here'")
-    sys.exit(1)
+# Every test in this module calls the Groq API
+pytestmark = pytest.mark.groq_api
 
 # Get the example PDF path relative to the tests directory
-EXAMPLE_PDF = str(Path(__file__).parent.parent / "example_docs" / "example.pdf")
+EXAMPLE_PDF = str(EXAMPLE_DOCS / "example.pdf")
 
-async def test_flask_integration_logic():
+# Files processed at once in the batch processing example
+BATCH_CONCURRENCY = 4
+
+@contextlib.asynccontextmanager
+async def shared_client(client=None):
+    """Yield the caller's AsyncGroq client, or a new one that is closed on exit"""
+    if client is not None:
+        yield client
+    else:
+        async with AsyncGroq() as new_client:
+            yield new_client
+
+async def test_flask_integration_logic(client=None):
     """Test the core logic from the Flask integration example"""
     print("🧪 Testing Flask Integration Logic...")
     
@@ -32,7 +41,7 @@ async def test_flask_integration_logic():
     filepath = EXAMPLE_PDF
     
     async def process():
-        return await extract_pdf_async(filepath, start_page=1, end_page=2)
+        return await extract_pdf_async(filepath, start_page=1, end_page=2, client=client)
     
     result, metadata = await process()
     
@@ -49,17 +58,21 @@ async def test_flask_integration_logic():
     print(f"   Data keys: {list(response_data['data'].keys())}")
     print("✅ Flask Integration - PASSED\n")
 
-async def test_fastapi_integration_logic():
+async def test_fastapi_integration_logic(client=None):
     """Test the core logic from the FastAPI integration example"""
     print("🧪 Testing FastAPI Integration Logic...")
     
     # Simulate file upload and processing
-    with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp:
-        # Copy example PDF to temp file (simulating upload)
-        shutil.copy(EXAMPLE_PDF, tmp.name)
-        tmp_path = tmp.name
-    
-    result, metadata = await extract_pdf_async(tmp_path, start_page=1, end_page=2)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_path = os.path.join(tmp_dir, "example.pdf")
+        try:
+            # Hard-link the example PDF (simulating upload) instead of copying its bytes
+            os.link(EXAMPLE_PDF, tmp_path)
+        except OSError:
+            # Temp dir on another filesystem, or no hard link support
+            shutil.copy(EXAMPLE_PDF, tmp_path)
+        
+        result, metadata = await extract_pdf_async(tmp_path, start_page=1, end_page=2, client=client)
     
     # Simulate the response
     response_data = {
@@ -72,28 +85,34 @@ async def test_fastapi_integration_logic():
     print(f"   Filename: {response_data['filename']}")
     print(f"   Pages processed: {response_data['pages_processed']}")
     print(f"   Processing time: {response_data['processing_time']:.2f}s")
-    
-    # Clean up temp file
-    os.unlink(tmp_path)
     print("✅ FastAPI Integration - PASSED\n")
 
-async def test_batch_processing():
+async def test_batch_processing(client=None):
     """Test the batch processing example logic"""
     print("🧪 Testing Batch Processing Logic...")
     
     # Simulate batch processing with one file
     pdf_files = [EXAMPLE_PDF]
     
-    for pdf_file in pdf_files:
-        print(f"Processing {os.path.basename(pdf_file)}")
-        
-        result, metadata = await extract_pdf_async(
-            pdf_file,
-            start_page=1,
-            end_page=2,
-            save_results=False  # Don't save for test
-        )
+    # Process files concurrently, at most BATCH_CONCURRENCY at a time
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+    
+    # One client for the whole batch, so every file reuses the same connections
+    async with shared_client(client) as client:
+        async def process(pdf_file):
+            async with semaphore:
+                print(f"Processing {os.path.basename(pdf_file)}")
+                return await extract_pdf_async(
+                    pdf_file,
+                    start_page=1,
+                    end_page=2,
+                    save_results=False,  # Don't save for test
+                    client=client
+                )
         
+        outcomes = await asyncio.gather(*(process(pdf_file) for pdf_file in pdf_files))
+    
+    for result, metadata in outcomes:
         print(f"  ✅ {len(result['page_results'])} pages in {metadata['processing_time_seconds']:.1f}s")
     
     print("✅ Batch Processing - PASSED\n")
@@ -102,9 +121,11 @@ async def main():
     """Run all integration tests"""
     print("🚀 Testing Integration Examples...\n")
     
-    await test_flask_integration_logic()
-    await test_fastapi_integration_logic()
-    await test_batch_processing()
+    # Share one client (and its keep-alive connections) across all three examples
+    async with shared_client() as client:
+        await test_flask_integration_logic(client)
+        await test_fastapi_integration_logic(client)
+        await test_batch_processing(client)
     
     print("🎉 All integration examples tested successfully!")
 
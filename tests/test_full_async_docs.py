@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Async tests that process ENTIRE example documents with the custom schema.
+These are stress tests for large document processing; each document takes
+several minutes, so run them in parallel with pytest-xdist (-n 4).
+"""
+
+import hashlib
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from groq_pdf_vision import make_extractor
+from groq_pdf_vision.utils import json_dumps, json_loads, COST_PER_TOKEN
+from _helpers import EXAMPLE_DOCS, cached_extract, format_sample_pages, make_progress_cb
+
+# Every test in this module calls the Groq API
+pytestmark = pytest.mark.groq_api
+
+# Get file paths relative to the tests directory
+CUSTOM_SCHEMA = str(EXAMPLE_DOCS / "example_custom_schema.json")
+
+# Parsed once at import and shared by every case; the hash of the raw bytes keys the result cache
+_SCHEMA_BYTES = Path(CUSTOM_SCHEMA).read_bytes()
+SCHEMA = json_loads(_SCHEMA_BYTES)
+SCHEMA_HASH = hashlib.sha256(_SCHEMA_BYTES).hexdigest()
+
+# Schema and options are bound once; every case reuses the same extractor
+EXTRACTOR = make_extractor(
+    SCHEMA,
+    enable_page_cache=True,
+    cached_schema=True,
+    max_concurrency=20,
+    pages_per_request=4,
+    max_edge=1600,
+    validate_pages=True
+)
+
+# One case per document so pytest-xdist can process them on separate workers;
+# page results are streamed to <id>_full_results.jsonl
+FULL_DOCUMENTS = [
+    pytest.param("vision2030.pdf", 85, id="vision2030"),
+    pytest.param("example.pdf", 76, id="example"),
+    pytest.param("americas_children_2023.pdf", 118, id="americas_children"),
+    pytest.param("fed_economic_wellbeing_2020.pdf", 88, id="fed_economic_wellbeing"),
+]
+
+# Leading pages previewed in the summary
+SAMPLE_PAGES = 3
+
+@pytest.mark.parametrize("pdf_name, expected_pages", FULL_DOCUMENTS)
+async def test_full_document(pdf_name, expected_pages, request):
+    """Test processing an ENTIRE document with the custom schema (async)"""
+    pdf_path = EXAMPLE_DOCS / pdf_name
+    if not pdf_path.exists():
+        pytest.skip(f"PDF file not found: {pdf_path}")
+
+    sys.stdout.write(f'🚀 Processing ENTIRE {pdf_name} with custom schema ({expected_pages} pages)...\n{"=" * 60}\n')
+
+    # Pages are written as JSON lines as each batch finishes; the summary counts
+    # and sample pages are gathered in the same pass instead of re-walking the results
+    output_file = f"{request.node.callspec.id}_full_results.jsonl"
+    counts = {"content": 0, "images": 0, "tables": 0}
+    samples = []
+
+    with open(output_file, 'wb') as f:
+        def write_page(page):
+            f.write(json_dumps(page) + b"\n")
+            counts["content"] += bool(page.get("content", "").strip())
+            counts["images"] += bool(page.get("contains_images", False))
+            counts["tables"] += bool(page.get("contains_tables", False))
+            if page.get("page_number", 0) <= SAMPLE_PAGES:
+                samples.append(page)
+
+        start_time = time.time()
+
+        # Repeat runs on unchanged inputs load the stored result instead of calling the API
+        result, metadata, from_cache = await cached_extract(
+            pdf_path,
+            SCHEMA,
+            schema_hash=SCHEMA_HASH,
+            extract=EXTRACTOR,
+            progress_callback=make_progress_cb(show_eta=True, every=1.0, overwrite=True),
+            page_callback=write_page
+        )
+
+        processing_time = time.time() - start_time
+
+    page_results = result["page_results"]
+    total_tokens = metadata["token_usage"]["total_tokens"]
+
+    assert metadata["pages_processed"] == expected_pages
+    assert page_results, "No page results returned"
+    # Pages that still failed after retries are reported, not fatal, up to 1% of the document
+    failed_pages = metadata.get("failed_pages", [])
+    assert len(failed_pages) <= expected_pages // 100, f"Pages failed after retries: {failed_pages}"
+
+    summary = [
+        '=' * 60,
+        f'✅ SUCCESS: {pdf_name} processing completed!',
+        f'⏱️  Total processing time: {processing_time:.1f} seconds ({processing_time/60:.1f} minutes)'
+        + (' [cached]' if from_cache else ''),
+        f'📄 Pages processed: {len(page_results)}',
+        f'🔤 Total tokens used: {total_tokens:,} (~${total_tokens * COST_PER_TOKEN:.4f})',
+        f'📈 Pages with text/images/tables: {counts["content"]}/{counts["images"]}/{counts["tables"]}',
+        f'💾 Results saved to: {output_file}',
+        format_sample_pages(sorted(samples, key=lambda page: page["page_number"]), SAMPLE_PAGES),
+    ]
+    sys.stdout.write("\n".join(summary) + "\n")
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, *sys.argv[1:]]))
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Offline tests for page image encoding and its upload size limit (no API key needed)
+"""
+
+import base64
+from io import BytesIO
+
+from PIL import Image
+
+from groq_pdf_vision import core
+from groq_pdf_vision.core import BASE64_IMAGE_SIZE_LIMIT_MB, JPEG_BYTES_PER_PIXEL, encode_image_to_base64
+
+# Lowest JPEG quality the encoder falls back to
+LOWEST_QUALITY = JPEG_BYTES_PER_PIXEL[-1][0]
+
+def noisy_image(size):
+    """An RGB image of random noise, which JPEG barely compresses"""
+    return Image.merge("RGB", [Image.effect_noise(size, 96) for _ in range(3)])
+
+def jpeg_bytes(image, quality):
+    """Encode image as JPEG at a fixed quality"""
+    buffer = BytesIO()
+    image.save(buffer, format="JPEG", quality=quality)
+    return buffer.getvalue()
+
+def test_small_image_keeps_the_requested_quality():
+    """An image well under the limit is encoded once, at the quality asked for"""
+    image = noisy_image((256, 256))
+    encoded = encode_image_to_base64(image, quality=85)
+    assert base64.b64decode(encoded) == jpeg_bytes(image, 85)
+
+def test_oversized_image_is_brought_under_the_limit():
+    """A page too large at the starting quality is re-encoded lower until it fits"""
+    image = noisy_image((2048, 2048))
+    limit = BASE64_IMAGE_SIZE_LIMIT_MB * 1024 * 1024
+    assert len(jpeg_bytes(image, 85)) * 4 / 3 > limit, "fixture must start over the limit"
+
+    encoded = encode_image_to_base64(image, quality=85)
+    assert len(encoded) <= limit
+    decoded = base64.b64decode(encoded)
+    # The result is one of the encoder's quality levels below the starting one
+    assert any(decoded == jpeg_bytes(image, quality) for quality, _ in JPEG_BYTES_PER_PIXEL if quality < 85)
+
+def test_encoding_stops_at_the_lowest_quality(monkeypatch):
+    """When nothing fits, the lowest quality level is returned rather than looping on"""
+    monkeypatch.setattr(core, "BASE64_IMAGE_SIZE_LIMIT_MB", 0.01)
+    image = noisy_image((512, 512))
+
+    encoded = encode_image_to_base64(image, quality=85)
+    assert base64.b64decode(encoded) == jpeg_bytes(image, LOWEST_QUALITY)
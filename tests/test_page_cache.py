@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Offline tests for the per-page response cache (no API key needed)
+"""
+
+import sqlite3
+import types
+
+import pytest
+
+from groq_pdf_vision import cache
+from groq_pdf_vision.cache import PageCache, page_cache_key
+
+PAGE = {"page_number": 1, "content": "Quarterly revenue", "contains_tables": False}
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Wall-clock time for the cache module that tests can move forward"""
+    fake = types.SimpleNamespace(now=1_000_000.0)
+    monkeypatch.setattr(cache, "time", types.SimpleNamespace(time=lambda: fake.now))
+    return fake
+
+@pytest.fixture
+def page_cache(tmp_path, clock):
+    """A cache in a temporary database with a one-hour lifetime"""
+    store = PageCache(str(tmp_path / "pages.sqlite"), ttl=3600)
+    yield store
+    store.close()
+
+def test_page_cache_key_depends_on_every_part():
+    """The image, schema and prompt context each change the key"""
+    key = page_cache_key("aW1hZ2U=", '{"type":"object"}', "model|prompt-v2")
+    assert key == page_cache_key("aW1hZ2U=", '{"type":"object"}', "model|prompt-v2")
+    assert key != page_cache_key("b3RoZXI=", '{"type":"object"}', "model|prompt-v2")
+    assert key != page_cache_key("aW1hZ2U=", '{"type":"array"}', "model|prompt-v2")
+    assert key != page_cache_key("aW1hZ2U=", '{"type":"object"}', "model|prompt-v3")
+    assert key != page_cache_key("aW1hZ2U=", '{"type":"object"}')
+
+def test_page_cache_key_length_prefixes_parts():
+    """Moving bytes between parts cannot produce the same key"""
+    assert page_cache_key("ab", "c", "") != page_cache_key("a", "bc", "")
+    assert page_cache_key("a", "b", "c") != page_cache_key("a", "", "bc")
+
+def test_get_returns_what_set_stored(page_cache):
+    """A stored page comes back equal; unknown keys miss"""
+    page_cache.set("page-1", PAGE)
+    assert page_cache.get("page-1") == PAGE
+    assert page_cache.get("page-2") is None
+
+def test_set_replaces_an_earlier_entry(page_cache):
+    """Storing under an existing key overwrites it"""
+    page_cache.set("page-1", PAGE)
+    page_cache.set("page-1", {**PAGE, "content": "Restated revenue"})
+    assert page_cache.get("page-1")["content"] == "Restated revenue"
+
+def test_get_many_and_set_many_keep_key_order(page_cache):
+    """Batch reads return one result or None per key, in the order asked"""
+    page_cache.set_many([("page-1", PAGE), ("page-3", {**PAGE, "page_number": 3})])
+    assert page_cache.get_many(["page-3", "page-2", "page-1"]) == [
+        {**PAGE, "page_number": 3}, None, PAGE
+    ]
+
+def test_entries_expire_after_ttl(page_cache, clock):
+    """An entry is served until its lifetime runs out and missed afterwards"""
+    page_cache.set("page-1", PAGE)
+    clock.now += 3599
+    assert page_cache.get("page-1") == PAGE
+    clock.now += 1
+    assert page_cache.get("page-1") is None
+    assert page_cache.get_many(["page-1"]) == [None]
+
+def test_opening_deletes_expired_rows(tmp_path, clock):
+    """Expired rows are removed from the file on open, live ones are kept"""
+    path = str(tmp_path / "pages.sqlite")
+    store = PageCache(path, ttl=3600)
+    store.set("old", PAGE)
+    clock.now += 1800
+    store.set("new", PAGE)
+    store.close()
+
+    clock.now += 1800
+    PageCache(path, ttl=3600).close()
+    conn = sqlite3.connect(path)
+    keys = [row[0] for row in conn.execute("SELECT key FROM responses")]
+    conn.close()
+    assert keys == ["new"]
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Offline tests for the client-side rate limiter (no API key needed)
+"""
+
+import asyncio
+import types
+
+import pytest
+
+from groq_pdf_vision import ratelimit
+from groq_pdf_vision.ratelimit import TokenBucket, shared_bucket
+
+# The real sleep, captured before the clock fixture replaces it
+REAL_SLEEP = asyncio.sleep
+
+class FakeClock:
+    """Monotonic time that only moves when the bucket sleeps"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+        await REAL_SLEEP(0)
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Drive TokenBucket from a fake clock so waits are exact and instant"""
+    fake = FakeClock()
+    monkeypatch.setattr(ratelimit, "time", types.SimpleNamespace(monotonic=fake.monotonic))
+    monkeypatch.setattr(asyncio, "sleep", fake.sleep)
+    return fake
+
+def test_full_bucket_allows_a_burst_of_capacity(clock):
+    """A new bucket serves its capacity at once and waits for one token's refill after that"""
+    async def run():
+        bucket = TokenBucket(60)
+        for _ in range(60):
+            await bucket.acquire()
+        assert clock.sleeps == []
+        await bucket.acquire()
+        assert clock.sleeps == [pytest.approx(1.0)]
+
+    asyncio.run(run())
+
+def test_tokens_refill_with_elapsed_time(clock):
+    """Tokens come back at rate_per_min / 60 per second"""
+    async def run():
+        bucket = TokenBucket(60)
+        await bucket.acquire(60)
+        clock.now += 30
+        await bucket.acquire(30)
+        assert clock.sleeps == []
+        await bucket.acquire()
+        assert clock.sleeps == [pytest.approx(1.0)]
+
+    asyncio.run(run())
+
+def test_refill_stops_at_capacity(clock):
+    """An idle bucket holds at most capacity tokens, however long it waited"""
+    async def run():
+        bucket = TokenBucket(60, capacity=5)
+        await bucket.acquire(5)
+        clock.now += 1000
+        await bucket.acquire(5)
+        assert clock.sleeps == []
+        await bucket.acquire()
+        assert clock.sleeps == [pytest.approx(1.0)]
+
+    asyncio.run(run())
+
+def test_cost_above_capacity_waits_for_the_deficit(clock):
+    """A cost larger than the bucket waits for the missing tokens and leaves it empty"""
+    async def run():
+        bucket = TokenBucket(60, capacity=10)
+        await bucket.acquire(25)
+        assert clock.sleeps == [pytest.approx(15.0)]
+        assert bucket.tokens == 0
+        await bucket.acquire()
+        assert clock.sleeps[1:] == [pytest.approx(1.0)]
+
+    asyncio.run(run())
+
+def test_waiters_are_served_in_arrival_order(clock):
+    """Callers blocked on an empty bucket get their tokens first come, first served"""
+    async def run():
+        bucket = TokenBucket(60, capacity=1)
+        await bucket.acquire()
+        served = []
+
+        async def take(name, cost):
+            await bucket.acquire(cost)
+            served.append(name)
+
+        # A cheap later request must not overtake an expensive earlier one
+        await asyncio.gather(take("first", 1), take("second", 3), take("third", 1))
+        assert served == ["first", "second", "third"]
+        assert clock.sleeps == [pytest.approx(1.0), pytest.approx(3.0), pytest.approx(1.0)]
+
+    asyncio.run(run())
+
+def test_shared_bucket_is_per_limit_rate_and_event_loop():
+    """Extractions on one loop share a bucket per limit and rate; another loop gets its own"""
+    async def buckets():
+        return shared_bucket("qpm", 30), shared_bucket("qpm", 30), shared_bucket("qpm", 60), shared_bucket("tpm", 30)
+
+    qpm, same_qpm, faster_qpm, tpm = asyncio.run(buckets())
+    assert qpm is same_qpm
+    assert qpm is not faster_qpm and qpm is not tpm
+    assert asyncio.run(buckets())[0] is not qpm
@@ -3,26 +3,59 @@
 Test script to verify all README examples work correctly
 """
 
-import os
 import asyncio
 import json
-import sys
-from pathlib import Path
 
-# Add parent directory to path so we can import the package
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
 
 from groq_pdf_vision import extract_pdf, extract_pdf_async
 from groq_pdf_vision.schema_helpers import create_base_schema, add_custom_fields
+from _helpers import EXAMPLE_DOCS, make_progress_cb
 
-# Check for API key - fail fast if not available
-if not os.environ.get("GROQ_API_KEY"):
-    print("❌ ERROR: GROQ_API_KEY environment variable not set")
-    print("   Please set your Groq API key: export GROQ_API_KEY='your-key-here'")
-    sys.exit(1)
+# Every test in this module calls the Groq API
+pytestmark = pytest.mark.groq_api
 
 # Get the example PDF path relative to the tests directory
-EXAMPLE_PDF = str(Path(__file__).parent.parent / "example_docs" / "example.pdf")
+EXAMPLE_PDF = str(EXAMPLE_DOCS / "example.pdf")
+
+# Schemas from the README examples, built once at import. add_custom_fields
+# returns a new schema without touching the base, so one base can be shared.
+BASE_SCHEMA = create_base_schema()
+
+CUSTOM_SCHEMA = add_custom_fields(BASE_SCHEMA, {
+    "product_names": {
+        "type": "array",
+        "items": {"type": "string"},
+        "description": "Product names mentioned"
+    },
+    "prices": {
+        "type": "array", 
+        "items": {"type": "string"},
+        "description": "Prices and costs mentioned"
+    }
+})
+
+FINANCIAL_SCHEMA = add_custom_fields(BASE_SCHEMA, {
+    "financial_figures": {
+        "type": "array",
+        "items": {"type": "string"},
+        "description": "Revenue, profit, costs, and other financial amounts"
+    },
+    "companies_mentioned": {
+        "type": "array",
+        "items": {"type": "string"},
+        "description": "Company names and organizations"
+    }
+})
+
+RESEARCH_SCHEMA = add_custom_fields(BASE_SCHEMA, {
+    "methodology": {"type": "string", "description": "Research methodology"},
+    "findings": {
+        "type": "array",
+        "items": {"type": "string"},
+        "description": "Key findings and results"
+    }
+})
 
 def test_basic_quick_start():
     """Test the basic Quick Start example"""
@@ -44,9 +77,7 @@ def test_sync_progress():
     """Test synchronous processing with progress callback"""
     print("🧪 Testing Sync Progress Example...")
     
-    def progress_callback(message, current, total):
-        percentage = (current / total) * 100
-        print(f"🔄 [{current}/{total}] ({percentage:.1f}%) {message}")
+    progress_callback = make_progress_cb()
 
     result = extract_pdf(
         EXAMPLE_PDF,
@@ -61,9 +92,7 @@ async def test_async_progress():
     """Test async processing with progress callback"""
     print("🧪 Testing Async Progress Example...")
     
-    def progress_callback(message, current, total):
-        percentage = (current / total) * 100
-        print(f"🔄 [{current}/{total}] ({percentage:.1f}%) {message}")
+    progress_callback = make_progress_cb()
 
     result, metadata = await extract_pdf_async(
         EXAMPLE_PDF,
@@ -111,21 +140,7 @@ def test_custom_schemas():
     print("✅ Default schema works")
 
     # Create a custom schema by extending the base
-    base_schema = create_base_schema()
-    custom_fields = {
-        "product_names": {
-            "type": "array",
-            "items": {"type": "string"},
-            "description": "Product names mentioned"
-        },
-        "prices": {
-            "type": "array", 
-            "items": {"type": "string"},
-            "description": "Prices and costs mentioned"
-        }
-    }
-    custom_schema = add_custom_fields(base_schema, custom_fields)
-    result = extract_pdf(EXAMPLE_PDF, start_page=1, end_page=1, schema=custom_schema)
+    result = extract_pdf(EXAMPLE_PDF, start_page=1, end_page=1, schema=CUSTOM_SCHEMA)
     print("✅ Custom schema with base extension works")
 
     # Or define a completely custom schema
@@ -153,40 +168,17 @@ def test_schema_building():
     print("✅ Default schema works")
 
     # Financial document extraction
-    base = create_base_schema()
-    financial_fields = {
-        "financial_figures": {
-            "type": "array",
-            "items": {"type": "string"},
-            "description": "Revenue, profit, costs, and other financial amounts"
-        },
-        "companies_mentioned": {
-            "type": "array",
-            "items": {"type": "string"},
-            "description": "Company names and organizations"
-        }
-    }
-    financial_schema = add_custom_fields(base, financial_fields)
-    result = extract_pdf(EXAMPLE_PDF, start_page=1, end_page=1, schema=financial_schema)
+    result = extract_pdf(EXAMPLE_PDF, start_page=1, end_page=1, schema=FINANCIAL_SCHEMA)
     print("✅ Financial schema works")
 
     # Research document extraction  
-    research_fields = {
-        "methodology": {"type": "string", "description": "Research methodology"},
-        "findings": {
-            "type": "array",
-            "items": {"type": "string"},
-            "description": "Key findings and results"
-        }
-    }
-    research_schema = add_custom_fields(base, research_fields)
-    result = extract_pdf(EXAMPLE_PDF, start_page=1, end_page=1, schema=research_schema)
+    result = extract_pdf(EXAMPLE_PDF, start_page=1, end_page=1, schema=RESEARCH_SCHEMA)
     print("✅ Research schema works")
 
     print("✅ Schema Building - PASSED\n")
 
-def test_sync_examples():
-    """Test all synchronous examples"""
+def run_sync_examples():
+    """Run all synchronous examples (pytest collects the individual tests)"""
     print("🚀 Testing Synchronous README Examples...\n")
     
     test_basic_quick_start()
@@ -197,8 +189,8 @@ def test_sync_examples():
     
     print("✅ All synchronous examples passed!")
 
-async def test_async_examples():
-    """Test all asynchronous examples"""
+async def run_async_examples():
+    """Run all asynchronous examples (pytest collects the individual tests)"""
     print("\n🚀 Testing Asynchronous README Examples...\n")
     
     await test_async_progress()
@@ -208,9 +200,9 @@ async def test_async_examples():
 
 if __name__ == "__main__":
     # Test sync examples first
-    test_sync_examples()
+    run_sync_examples()
     
     # Then test async examples
-    asyncio.run(test_async_examples())
+    asyncio.run(run_async_examples())
     
     print("\n🎉 All README examples tested successfully!") 
\ No newline at end of file
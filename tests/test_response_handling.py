@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Offline tests for model response salvage and retry classification (no API key needed)
+"""
+
+import json
+
+import httpx
+import pytest
+from groq import (
+    APIConnectionError, APIStatusError, APITimeoutError, AuthenticationError, BadRequestError,
+    InternalServerError, NotFoundError, PermissionDeniedError, RateLimitError, UnprocessableEntityError
+)
+
+from groq_pdf_vision.core import _extract_json_object, _is_retryable
+
+REQUEST = httpx.Request("POST", "https://api.groq.com/openai/v1/chat/completions")
+PAGES = {"pages": [{"page_number": 1, "content": "Revenue {grew} \"fast\""}]}
+PAGES_JSON = json.dumps(PAGES)
+
+def status_error(error_class, status_code, message="Error"):
+    """Build a groq status error as the client raises it for an HTTP response"""
+    return error_class(message, response=httpx.Response(status_code, request=REQUEST), body=None)
+
+@pytest.mark.parametrize("content", [
+    pytest.param(PAGES_JSON, id="bare"),
+    pytest.param(f"```json\n{PAGES_JSON}\n```", id="fenced"),
+    pytest.param(f"Here is the extracted data:\n{PAGES_JSON}", id="prefixed"),
+    pytest.param(f"Sure! {PAGES_JSON}\nLet me know if you need anything else.", id="wrapped"),
+])
+def test_extract_json_object_recovers_the_object(content):
+    """The outermost object is cut out of fences and prose around it"""
+    assert json.loads(_extract_json_object(content)) == PAGES
+
+def test_extract_json_object_ignores_braces_in_strings():
+    """Braces and escaped quotes inside string values do not end the object early"""
+    content = '{"content": "a } b \\" } c", "nested": {"x": "{"}} trailing }'
+    assert _extract_json_object(content) == '{"content": "a } b \\" } c", "nested": {"x": "{"}}'
+
+@pytest.mark.parametrize("content", [
+    pytest.param(PAGES_JSON[:-5], id="truncated"),
+    pytest.param(f"```json\n{PAGES_JSON[:40]}", id="truncated-fenced"),
+    pytest.param("I could not read this page.", id="no-object"),
+    pytest.param("", id="empty"),
+])
+def test_extract_json_object_rejects_unbalanced_output(content):
+    """Output without a complete object yields None, so the batch is retried"""
+    assert _extract_json_object(content) is None
+
+@pytest.mark.parametrize("error", [
+    pytest.param(status_error(RateLimitError, 429), id="rate-limit"),
+    pytest.param(status_error(InternalServerError, 500), id="internal-server-error"),
+    pytest.param(status_error(InternalServerError, 503), id="service-unavailable"),
+    pytest.param(APIConnectionError(request=REQUEST), id="connection"),
+    pytest.param(APITimeoutError(request=REQUEST), id="timeout"),
+    pytest.param(status_error(
+        BadRequestError, 400, "Error code: 400 - {'error': {'code': 'json_validate_failed'}}"
+    ), id="json-validate-failed"),
+    pytest.param(status_error(APIStatusError, 408), id="request-timeout"),
+    pytest.param(status_error(APIStatusError, 409), id="conflict"),
+    pytest.param(ValueError("Invalid JSON in model response"), id="invalid-output"),
+])
+def test_transient_errors_are_retried(error):
+    """Rate limits, server and connection errors, JSON mode rejections and bad output are retried"""
+    assert _is_retryable(error)
+
+@pytest.mark.parametrize("error", [
+    pytest.param(status_error(BadRequestError, 400, "Error code: 400 - model not found"), id="bad-request"),
+    pytest.param(status_error(AuthenticationError, 401), id="authentication"),
+    pytest.param(status_error(PermissionDeniedError, 403), id="permission-denied"),
+    pytest.param(status_error(NotFoundError, 404), id="not-found"),
+    pytest.param(status_error(UnprocessableEntityError, 422), id="unprocessable"),
+])
+def test_permanent_errors_fail_fast(error):
+    """API rejections that would fail the same way again are not retried"""
+    assert not _is_retryable(error)